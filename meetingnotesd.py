@@ -5,6 +5,7 @@
 #     "flask>=3.0.0",
 #     "pyyaml>=6.0.0",
 #     "requests>=2.31.0",
+#     "waitress>=3.0.0",
 # ]
 # ///
 """
@@ -43,6 +44,8 @@ from datetime import datetime, timedelta
 import logging
 import yaml
 from pathlib import Path
+import queue
+import shutil
 import subprocess
 import threading
 import time
@@ -60,19 +63,55 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
+# Optional: C-extension JSON for request parse and response serialization.
+# Falls back silently to Flask's stdlib-based provider when not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs) -> str:
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+# Resolved once so git spawns get an absolute executable path (one of the
+# conditions for subprocess's posix_spawn fast path).
+GIT_EXECUTABLE = shutil.which('git') or 'git'
+
 # Load configuration
 CONFIG_FILE = os.getenv('WEBHOOK_CONFIG', 'config.yaml')
 
 
+# Prefer the libyaml C loader; fall back to the pure-Python one if PyYAML
+# was built without it.
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
+
 def load_config() -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file.
+
+    Parsed fresh on every start: the file is a couple of KB and the C
+    loader handles it in well under a millisecond, which is not worth a
+    cache file — least of all one unpickled from a shared directory.
+    """
     config_path = Path(CONFIG_FILE)
     if not config_path.exists():
         logger.error(f"Configuration file not found: {CONFIG_FILE}")
         raise FileNotFoundError(f"Configuration file not found: {CONFIG_FILE}")
 
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_YamlSafeLoader) or {}
 
 
 def _get_nested(config: dict, keys: list[str], default=None):
@@ -84,6 +123,18 @@ def _get_nested(config: dict, keys: list[str], default=None):
     return current
 
 
+def _section(config: dict, *keys: str) -> dict:
+    """Return a nested config sub-dict, or {} if missing/not a dict.
+
+    Lets callers walk each config section once and then read fields with
+    plain .get() instead of re-traversing from the top for every key.
+    """
+    current = config
+    for key in keys:
+        current = current.get(key) if isinstance(current, dict) else None
+    return current if isinstance(current, dict) else {}
+
+
 def _normalize_repo_url(repo_url: str | None) -> str | None:
     if not repo_url:
         return None
@@ -99,69 +150,161 @@ class RepoAgent:
     def __init__(self, config: dict):
         self.config = config
 
-        self.host = _get_nested(config, ['server', 'host'], '127.0.0.1')
-        self.port = int(_get_nested(config, ['server', 'port'], 9876))
+        # Walk each config section once instead of re-traversing from the
+        # top-level dict for every field.
+        server = _section(config, 'server')
+        git = _section(config, 'git')
+        sync = _section(config, 'sync')
+        dispatch = _section(config, 'github', 'workflow_dispatch')
+        hook = _section(config, 'hooks', 'on_new_commits')
+        standalone = _section(config, 'processing', 'standalone')
+
+        self.host = server.get('host', '127.0.0.1')
+        self.port = int(server.get('port', 9876))
 
         # Data repo path - inbox is always {repo}/inbox
         self.repo_dir = config.get('data_repo') or _get_nested(config, ['directories', 'repository'], '.')
         self.inbox_dir = str(Path(self.repo_dir) / 'inbox')
 
-        self.git_auto_commit = bool(_get_nested(config, ['git', 'auto_commit'], False))
-        self.git_auto_push = bool(_get_nested(config, ['git', 'auto_push'], False))
-        self.git_repo_url = _normalize_repo_url(_get_nested(config, ['git', 'repository_url']))
-        self.git_commit_template = _get_nested(config, ['git', 'commit_message_template'], 'Add transcript: {title}')
+        # Resolve once: repo_dir never changes after init, and _run_git
+        # passes the repo path as cwd for every git spawn — resolving per
+        # call would pay realpath syscalls each time.
+        self._repo_path_cached = Path(self.repo_dir).resolve()
+        self._inbox_path_cached = Path(self.inbox_dir).resolve()
+        self._repo_path_str = str(self._repo_path_cached)
+        self.calendar_path = str(Path(self.repo_dir) / 'calendar.org')
+
+        self.git_auto_commit = bool(git.get('auto_commit', False))
+        self.git_auto_push = bool(git.get('auto_push', False))
+        self.git_repo_url = _normalize_repo_url(git.get('repository_url'))
+        self.git_commit_template = git.get('commit_message_template', 'Add transcript: {title}')
 
         # Backwards-compatible default: if auto-push is on, keep doing a safe pull before push.
-        self.sync_enabled = bool(_get_nested(config, ['sync', 'enabled'], self.git_auto_push))
-        self.sync_on_startup = bool(_get_nested(config, ['sync', 'on_startup'], True))
-        self.sync_before_accepting_webhooks = bool(_get_nested(config, ['sync', 'before_accepting_webhooks'], True))
-        self.sync_poll_interval_seconds = float(_get_nested(config, ['sync', 'poll_interval_seconds'], 0) or 0)
-        self.sync_ff_only = bool(_get_nested(config, ['sync', 'ff_only'], True))
+        self.sync_enabled = bool(sync.get('enabled', self.git_auto_push))
+        self.sync_on_startup = bool(sync.get('on_startup', True))
+        self.sync_before_accepting_webhooks = bool(sync.get('before_accepting_webhooks', True))
+        self.sync_poll_interval_seconds = float(sync.get('poll_interval_seconds', 0) or 0)
+        self.sync_ff_only = bool(sync.get('ff_only', True))
+        # Minimum seconds between pre-accept syncs: a burst of webhooks
+        # inside this window shares one git pull.
+        self.sync_min_interval_seconds = float(sync.get('min_interval_seconds', 30))
 
         # Git remote/branch settings (used for clone, pull, push)
-        self.git_remote = _get_nested(config, ['git', 'remote'], 'origin')
-        self.git_branch = _get_nested(config, ['git', 'branch'], 'main')
+        self.git_remote = git.get('remote', 'origin')
+        self.git_branch = git.get('branch', 'main')
 
-        self.workflow_dispatch_enabled = bool(_get_nested(config, ['github', 'workflow_dispatch', 'enabled'], False))
-        self.workflow_dispatch_repo = _get_nested(config, ['github', 'workflow_dispatch', 'repo'])
-        self.workflow_dispatch_workflow = _get_nested(config, ['github', 'workflow_dispatch', 'workflow'])
-        self.workflow_dispatch_ref = _get_nested(config, ['github', 'workflow_dispatch', 'ref'], 'main')
-        self.workflow_dispatch_inputs = _get_nested(config, ['github', 'workflow_dispatch', 'inputs'], {}) or {}
+        self.workflow_dispatch_enabled = bool(dispatch.get('enabled', False))
+        self.workflow_dispatch_repo = dispatch.get('repo')
+        self.workflow_dispatch_workflow = dispatch.get('workflow')
+        self.workflow_dispatch_ref = dispatch.get('ref', 'main')
+        self.workflow_dispatch_inputs = dispatch.get('inputs') or {}
 
-        self.hook_on_new_commits_enabled = bool(_get_nested(config, ['hooks', 'on_new_commits', 'enabled'], False))
-        self.hook_on_new_commits_command = _get_nested(config, ['hooks', 'on_new_commits', 'command'])
-        self.hook_working_directory = _get_nested(config, ['hooks', 'on_new_commits', 'working_directory'], '.')
-        self.hook_timeout_seconds = int(_get_nested(config, ['hooks', 'on_new_commits', 'timeout_seconds'], 600))
+        self.hook_on_new_commits_enabled = bool(hook.get('enabled', False))
+        self.hook_on_new_commits_command = hook.get('command')
+        self.hook_working_directory = hook.get('working_directory', '.')
+        self.hook_timeout_seconds = int(hook.get('timeout_seconds', 600))
 
         # Standalone mode: process transcripts locally instead of dispatching to GitHub Actions
-        self.standalone_enabled = bool(_get_nested(config, ['processing', 'standalone', 'enabled'], False))
-        self.standalone_command = _get_nested(config, ['processing', 'standalone', 'command'], 'uv run run_summarization.py --git')
-        self.standalone_working_directory = _get_nested(config, ['processing', 'standalone', 'working_directory'], '.')
-        self.standalone_timeout_seconds = int(_get_nested(config, ['processing', 'standalone', 'timeout_seconds'], 1800))
+        self.standalone_enabled = bool(standalone.get('enabled', False))
+        self.standalone_command = standalone.get('command', 'uv run run_summarization.py --git')
+        self.standalone_working_directory = standalone.get('working_directory', '.')
+        self.standalone_timeout_seconds = int(standalone.get('timeout_seconds', 1800))
         # Async mode: return immediately after saving file, process in background
-        self.standalone_async = bool(_get_nested(config, ['processing', 'standalone', 'async'], False))
+        self.standalone_async = bool(standalone.get('async', False))
+        # Coalesced commits: skip the inbox-only commit and let the
+        # processor's commit carry transcript + notes together (one commit
+        # and one push per webhook instead of two commits)
+        self.standalone_coalesce_commits = bool(standalone.get('coalesce_commits', False))
+
+        # Command strings never change at runtime; tokenize them once
+        # instead of running shlex on every hook/processing invocation.
+        self._standalone_argv = shlex.split(self.standalone_command) if self.standalone_command else []
+        self._hook_argv = shlex.split(self.hook_on_new_commits_command) if self.hook_on_new_commits_command else []
+
+        # Queued webhook mode: /webhook returns 202 immediately and worker
+        # threads do the filesystem/git work off the request thread.
+        webhook_queue = _section(config, 'server', 'webhook_queue')
+        self.queue_enabled = bool(webhook_queue.get('enabled', False))
+        self.queue_workers = int(webhook_queue.get('workers', 2))
+        self.queue_maxsize = int(webhook_queue.get('maxsize', 256))
+        self._webhook_queue: queue.Queue | None = (
+            queue.Queue(maxsize=self.queue_maxsize) if self.queue_enabled else None
+        )
+        self._worker_threads: list[threading.Thread] = []
+        self._push_pending = False
+
+        # The health payload is derived entirely from config, which is
+        # immutable after init — build it once instead of per request.
+        self.health_payload = {
+            'status': 'ok',
+            'service': 'meetingnotesd',
+            'inbox_dir': self.inbox_dir,
+            'repository': self.repo_dir,
+            'port': self.port,
+            'endpoints': {
+                'health': '/',
+                'transcript': '/webhook',
+                'calendar': '/calendar',
+            },
+            'processing_mode': 'standalone' if self.standalone_enabled else 'relay',
+            'sync': {
+                'enabled': self.sync_enabled,
+                'poll_interval_seconds': self.sync_poll_interval_seconds,
+            },
+            'standalone': {
+                'enabled': self.standalone_enabled,
+                'command': self.standalone_command if self.standalone_enabled else None,
+            },
+            'relay': {
+                'workflow_dispatch_enabled': self.workflow_dispatch_enabled,
+                'repo': self.workflow_dispatch_repo if self.workflow_dispatch_enabled else None,
+                'workflow': self.workflow_dispatch_workflow if self.workflow_dispatch_enabled else None,
+            },
+        }
 
-        self._lock = threading.Lock()
+        # Two locks so webhook writes never serialize behind a background
+        # git pull: _fs_lock orders inbox/calendar writes and the
+        # write -> commit -> process -> push pipeline, while _git_lock is
+        # taken (reentrantly) inside every git index operation — pull,
+        # commit, push and its retry pull, standalone processing — so a
+        # background sync can never race a commit for index.lock.
+        self._fs_lock = threading.Lock()
+        self._git_lock = threading.RLock()
         self._stop_event = threading.Event()
         self._sync_thread: threading.Thread | None = None
         self._processing_thread: threading.Thread | None = None
+        self._last_sync_monotonic = float('-inf')
+        self._inbox_ok = False
+
+        # Persistent HTTP session: workflow dispatches reuse the TCP/TLS
+        # connection to api.github.com instead of handshaking per call.
+        self._http = requests.Session()
+        self._http.headers.update({
+            'Accept': 'application/vnd.github+json',
+            'X-GitHub-Api-Version': '2022-11-28',
+        })
 
     def _token(self) -> str | None:
         return os.environ.get('GH_TOKEN')
 
     def _repo_path(self) -> Path:
-        return Path(self.repo_dir).resolve()
+        return self._repo_path_cached
 
     def _inbox_path(self) -> Path:
-        return Path(self.inbox_dir).resolve()
+        return self._inbox_path_cached
 
     def _run_git(self, args: list[str], *, timeout: int = 30) -> subprocess.CompletedProcess:
+        # `git -C <repo>` instead of cwd=, an absolute executable path,
+        # and close_fds=False keep the call inside subprocess's
+        # posix_spawn fast path: cwd= (among others) forces the slower
+        # fork+exec route, which pays a page-table copy of the whole
+        # daemon per git command.
         return subprocess.run(
-            ['git', *args],
-            cwd=self._repo_path(),
+            [GIT_EXECUTABLE, '-C', self._repo_path_str, *args],
             capture_output=True,
             text=True,
             timeout=timeout,
+            close_fds=False,
         )
 
     def ensure_repo_checkout(self) -> None:
@@ -178,7 +321,7 @@ class RepoAgent:
             )
 
         repo_path.parent.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Cloning data repo into {repo_path}...")
+        logger.info("Cloning data repo into %s...", repo_path)
 
         result = subprocess.run(
             ['git', 'clone', '--branch', str(self.git_branch), '--single-branch', clone_url, str(repo_path)],
@@ -201,21 +344,75 @@ class RepoAgent:
         if not self.sync_enabled:
             return False, "sync disabled"
 
-        self.ensure_repo_checkout()
-        before = self._get_head_sha()
+        with self._git_lock:
+            self.ensure_repo_checkout()
+            before = self._get_head_sha()
 
-        pull_args = ['pull']
-        if self.sync_ff_only:
-            pull_args.append('--ff-only')
-        pull_args.extend([str(self.git_remote), str(self.git_branch)])
+            pull_args = ['pull']
+            if self.sync_ff_only:
+                pull_args.append('--ff-only')
+            pull_args.extend([str(self.git_remote), str(self.git_branch)])
 
-        result = self._run_git(pull_args, timeout=60)
-        if result.returncode != 0:
-            return False, f"git pull failed: {result.stderr.strip()}"
+            result = self._run_git(pull_args, timeout=60)
+            if result.returncode != 0:
+                return False, f"git pull failed: {result.stderr.strip()}"
+            self._last_sync_monotonic = time.monotonic()
+
+            after = self._get_head_sha()
+            changed = bool(before and after and before != after)
+            if changed:
+                # The pulled tree may have removed directories we rely on
+                self._inbox_ok = False
+            return changed, ("pulled new commits" if changed else "already up to date")
+
+    def _ensure_inbox(self) -> None:
+        """Create the inbox directory if needed, checking only once.
 
-        after = self._get_head_sha()
-        changed = bool(before and after and before != after)
-        return changed, ("pulled new commits" if changed else "already up to date")
+        Avoids a stat + mkdir attempt on every webhook; the flag resets
+        whenever a sync pulls new commits.
+        """
+        if self._inbox_ok:
+            return
+        os.makedirs(self.inbox_dir, exist_ok=True)
+        self._inbox_ok = True
+
+    def recently_synced(self) -> bool:
+        """True when the background sync thread is healthy and pulled recently.
+
+        Lets request handlers skip their pre-accept pull — a network round
+        trip on the critical path — when the poll loop has it covered.
+        """
+        if self.sync_poll_interval_seconds <= 0:
+            return False
+        if not (self._sync_thread and self._sync_thread.is_alive()):
+            return False
+        return time.monotonic() - self._last_sync_monotonic < self.sync_poll_interval_seconds * 1.5
+
+    def maybe_sync_before_accept(self, context: str, *, run_hook: bool = True) -> None:
+        """Run the pre-accept sync + hook unless a recent one covers us.
+
+        Applies both the background-poll freshness check and a minimum
+        interval between pre-accept pulls, with a second check under the
+        lock so a burst of concurrent requests coalesces into one pull.
+        """
+        if not (self.sync_enabled and self.sync_before_accepting_webhooks):
+            return
+        if self.recently_synced():
+            return
+        if time.monotonic() - self._last_sync_monotonic < self.sync_min_interval_seconds:
+            return
+        with self._git_lock:
+            if time.monotonic() - self._last_sync_monotonic < self.sync_min_interval_seconds:
+                return  # another request synced while we waited on the lock
+            try:
+                changed, msg = self.sync_repo()
+                logger.info("Pre-%s sync: %s", context, msg)
+                if changed and run_hook:
+                    ok, hook_msg = self._run_hook_on_new_commits()
+                    if not ok:
+                        logger.warning(hook_msg)
+            except Exception as e:
+                logger.warning("Pre-%s sync failed: %s", context, e)
 
     def _run_hook_on_new_commits(self) -> tuple[bool, str]:
         if not self.hook_on_new_commits_enabled:
@@ -230,8 +427,8 @@ class RepoAgent:
             # If it's a file or otherwise invalid, let subprocess surface the error.
             pass
 
-        args = shlex.split(self.hook_on_new_commits_command)
-        logger.info(f"Running hook: {args} (cwd={working_dir})")
+        args = self._hook_argv
+        logger.info("Running hook: %s (cwd=%s)", args, working_dir)
         result = subprocess.run(
             args,
             cwd=working_dir,
@@ -268,61 +465,97 @@ class RepoAgent:
         env = os.environ.copy()
         env['WORKSPACE_DIR'] = str(self._repo_path())
 
-        args = shlex.split(self.standalone_command)
-        logger.info(f"Running standalone processing: {args} (cwd={working_dir}, WORKSPACE_DIR={env['WORKSPACE_DIR']})")
+        args = self._standalone_argv
+        logger.info("Running standalone processing: %s (cwd=%s, WORKSPACE_DIR=%s)", args, working_dir, env['WORKSPACE_DIR'])
 
-        import time as _time
-        try:
-            start_time = _time.monotonic()
-            process = subprocess.Popen(
-                args,
-                cwd=working_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                env=env,
-            )
-            output_lines = []
-            last_progress = start_time
-            deadline = start_time + self.standalone_timeout_seconds
-
-            import select
-            while process.poll() is None:
-                # Use select to read with a timeout so we can check deadline
-                ready, _, _ = select.select([process.stdout], [], [], 5.0)
-                if ready:
-                    line = process.stdout.readline()
-                    if line:
-                        output_lines.append(line)
-                        logger.info(f"  proc: {line.rstrip()}")
-                now = _time.monotonic()
-                if now - last_progress >= 30:
-                    elapsed = int(now - start_time)
-                    logger.info(f"  ... still running ({elapsed}s, {len(output_lines)} lines)")
-                    last_progress = now
-                if now > deadline:
-                    process.kill()
-                    process.wait()
-                    return False, f"standalone processing timed out after {self.standalone_timeout_seconds}s"
-
-            # Read remaining output after process exits
-            for line in process.stdout:
-                output_lines.append(line)
-                logger.info(f"  proc: {line.rstrip()}")
-
-            elapsed = int(_time.monotonic() - start_time)
-        except Exception as e:
-            return False, f"standalone processing failed: {e}"
+        # The child commits with --git, so it owns the index while it runs
+        with self._git_lock:
+            import time as _time
+            try:
+                start_time = _time.monotonic()
+                process = subprocess.Popen(
+                    args,
+                    cwd=working_dir,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    env=env,
+                )
+                output_lines = []
+                last_progress = start_time
+                deadline = start_time + self.standalone_timeout_seconds
+
+                # Batch subprocess output into grouped log records: chatty
+                # summarization runs can emit hundreds of lines/sec, and one
+                # logger call per line (lock + format + write) dominates the
+                # wait loop. Flush every 32 lines or once a second.
+                log_buf: list[str] = []
+                last_flush = start_time
+
+                def _flush_log_buf() -> None:
+                    if log_buf:
+                        logger.info("proc output:\n%s", "\n".join(log_buf))
+                        log_buf.clear()
+
+                # Event-driven wait: wake only when output arrives or the next
+                # deadline (progress log or timeout) is due, and drain all
+                # available bytes per wakeup instead of one readline per poll.
+                import selectors
+                stdout_fd = process.stdout.fileno()
+                os.set_blocking(stdout_fd, False)
+                sel = selectors.DefaultSelector()
+                sel.register(process.stdout, selectors.EVENT_READ)
+                pending = b''
+                while process.poll() is None:
+                    now = _time.monotonic()
+                    if now > deadline:
+                        process.kill()
+                        process.wait()
+                        return False, f"standalone processing timed out after {self.standalone_timeout_seconds}s"
+                    wait = min((last_progress + 30) - now, deadline - now)
+                    if sel.select(max(wait, 0.05)):
+                        try:
+                            chunk = os.read(stdout_fd, 65536)
+                        except BlockingIOError:
+                            chunk = b''
+                        if chunk:
+                            pending += chunk
+                            *complete, pending = pending.split(b'\n')
+                            for raw in complete:
+                                line = raw.decode('utf-8', errors='replace')
+                                output_lines.append(line + '\n')
+                                log_buf.append(f"  proc: {line.rstrip()}")
+                    now = _time.monotonic()
+                    if len(log_buf) >= 32 or (log_buf and now - last_flush >= 1.0):
+                        _flush_log_buf()
+                        last_flush = now
+                    if now - last_progress >= 30:
+                        elapsed = int(now - start_time)
+                        logger.info("  ... still running (%ss, %s lines)", elapsed, len(output_lines))
+                        last_progress = now
+                sel.close()
+
+                # Read remaining output after process exits
+                os.set_blocking(stdout_fd, True)
+                pending += process.stdout.read() or b''
+                for raw in pending.split(b'\n'):
+                    if raw:
+                        line = raw.decode('utf-8', errors='replace')
+                        output_lines.append(line + '\n')
+                        log_buf.append(f"  proc: {line.rstrip()}")
+                _flush_log_buf()
+
+                elapsed = int(_time.monotonic() - start_time)
+            except Exception as e:
+                return False, f"standalone processing failed: {e}"
 
-        if process.returncode != 0:
-            detail = ''.join(output_lines[-10:]).strip() or 'non-zero exit'
-            if len(detail) > 500:
-                detail = detail[:500] + '...'
-            return False, f"standalone processing failed (exit {process.returncode}, {elapsed}s): {detail}"
+            if process.returncode != 0:
+                detail = ''.join(output_lines[-10:]).strip() or 'non-zero exit'
+                if len(detail) > 500:
+                    detail = detail[:500] + '...'
+                return False, f"standalone processing failed (exit {process.returncode}, {elapsed}s): {detail}"
 
-        logger.info(f"Standalone processing completed in {elapsed}s")
-        return True, "standalone processing completed"
+            logger.info("Standalone processing completed in %ss", elapsed)
+            return True, "standalone processing completed"
 
     def run_standalone_processing_async(self) -> None:
         """Run standalone processing in background thread, then push results.
@@ -336,14 +569,14 @@ class RepoAgent:
 
         def _background_task():
             try:
-                with self._lock:
+                with self._fs_lock:
                     proc_ok, proc_msg = self.run_standalone_processing()
                     if proc_ok:
-                        logger.info(f"Background processing succeeded: {proc_msg}")
+                        logger.info("Background processing succeeded: %s", proc_msg)
                         if self.git_auto_push:
                             push_ok, push_msg = self.git_push()
                             if push_ok:
-                                logger.info(f"Background push succeeded: {push_msg}")
+                                logger.info("Background push succeeded: %s", push_msg)
                             else:
                                 logger.error(f"Background push failed: {push_msg}")
                     else:
@@ -356,6 +589,214 @@ class RepoAgent:
         self._processing_thread.start()
         logger.info("Started background processing thread")
 
+    def process_transcript_payload(self, title: str, transcript_bytes: bytes,
+                                   filename: str, *, defer_push: bool = False) -> dict:
+        """Write a transcript into the inbox and run the git/processing pipeline.
+
+        Shared by the synchronous /webhook path and the queue workers.
+        Returns the response payload describing what happened. With
+        defer_push=True the push is skipped and marked pending so
+        back-to-back queued transcripts can share a single push (relay
+        mode still pushes, since workflow dispatch needs the file on the
+        remote first).
+        """
+        with self._fs_lock:
+            filepath = os.path.join(self.inbox_dir, filename)
+
+            # Ensure inbox directory exists (cached after the first check)
+            self._ensure_inbox()
+
+            # Write transcript to file
+            _atomic_write_bytes(filepath, transcript_bytes)
+
+            logger.info("Successfully wrote transcript to: %s", filepath)
+
+            response_data = {
+                'status': 'success',
+                'filename': filename,
+                'message': 'Transcript queued for processing'
+            }
+
+            # Commit and push to git if enabled
+            if self.git_auto_commit:
+                logger.info("Initiating git commit...")
+                # Ensure repo exists before committing
+                if self.sync_enabled:
+                    self.ensure_repo_checkout()
+
+                # Coalesced standalone mode: skip the inbox-only commit and
+                # let the processor's own commit carry the transcript and
+                # notes together — one commit/push per webhook instead of
+                # two. If processing fails, commit the raw transcript so
+                # it is never lost.
+                if (self.standalone_enabled and not self.standalone_async
+                        and self.standalone_coalesce_commits):
+                    proc_ok, proc_msg = self.run_standalone_processing()
+                    response_data['processing'] = {
+                        'mode': 'standalone',
+                        'async': False,
+                        'success': proc_ok,
+                        'message': proc_msg,
+                    }
+                    if proc_ok:
+                        response_data['git'] = {
+                            'enabled': True,
+                            'committed': True,
+                            'message': 'Committed by processor (coalesced)',
+                        }
+                        if self.git_auto_push:
+                            if defer_push:
+                                self._push_pending = True
+                                response_data['git']['pushed'] = False
+                                response_data['git']['push_message'] = 'deferred (queue draining)'
+                            else:
+                                push_ok, push_msg = self.git_push()
+                                response_data['git']['pushed'] = push_ok
+                                response_data['git']['push_message'] = push_msg
+                                if not push_ok:
+                                    logger.warning("Push after standalone processing failed: %s", push_msg)
+                    else:
+                        commit_ok, commit_msg = self.git_commit(filepath, title)
+                        response_data['git'] = {
+                            'enabled': True,
+                            'committed': commit_ok,
+                            'message': commit_msg,
+                        }
+                        if not commit_ok:
+                            response_data['warning'] = 'File saved but git commit failed'
+                            logger.warning("Git commit failed but file was saved: %s", commit_msg)
+                    return response_data
+
+                commit_ok, commit_msg = self.git_commit(filepath, title)
+                response_data['git'] = {
+                    'enabled': True,
+                    'committed': commit_ok,
+                    'message': commit_msg
+                }
+
+                if not commit_ok:
+                    # File was saved but git failed - still return success with warning
+                    response_data['warning'] = 'File saved but git commit failed'
+                    logger.warning("Git commit failed but file was saved: %s", commit_msg)
+                else:
+                    # Choose processing mode: standalone (local) or relay (workflow dispatch)
+                    if self.standalone_enabled:
+                        if self.standalone_async:
+                            # Async mode: return immediately, process in background
+                            self.run_standalone_processing_async()
+                            response_data['processing'] = {
+                                'mode': 'standalone',
+                                'async': True,
+                                'message': 'Processing started in background',
+                            }
+                        else:
+                            # Sync mode: wait for processing to complete
+                            proc_ok, proc_msg = self.run_standalone_processing()
+                            response_data['processing'] = {
+                                'mode': 'standalone',
+                                'async': False,
+                                'success': proc_ok,
+                                'message': proc_msg,
+                            }
+                            # Push all commits (inbox + processing results) together
+                            if proc_ok and self.git_auto_push:
+                                if defer_push:
+                                    self._push_pending = True
+                                    response_data['git']['pushed'] = False
+                                    response_data['git']['push_message'] = 'deferred (queue draining)'
+                                else:
+                                    push_ok, push_msg = self.git_push()
+                                    response_data['git']['pushed'] = push_ok
+                                    response_data['git']['push_message'] = push_msg
+                                    if not push_ok:
+                                        logger.warning("Push after standalone processing failed: %s", push_msg)
+                    else:
+                        # Relay mode: push immediately so GitHub Actions can access the file
+                        if self.git_auto_push:
+                            push_ok, push_msg = self.git_push()
+                            response_data['git']['pushed'] = push_ok
+                            response_data['git']['push_message'] = push_msg
+                            if not push_ok:
+                                logger.warning("Push failed: %s", push_msg)
+                                # Don't dispatch workflow if push failed
+                                response_data['processing'] = {
+                                    'mode': 'relay',
+                                    'workflow_dispatch': {
+                                        'enabled': self.workflow_dispatch_enabled,
+                                        'success': False,
+                                        'message': 'Skipped: push failed',
+                                    }
+                                }
+                            else:
+                                dispatch_ok, dispatch_msg = self.maybe_dispatch_workflow(reason=f"webhook:{filename}")
+                                response_data['processing'] = {
+                                    'mode': 'relay',
+                                    'workflow_dispatch': {
+                                        'enabled': self.workflow_dispatch_enabled,
+                                        'success': dispatch_ok,
+                                        'message': dispatch_msg,
+                                    }
+                                }
+                        else:
+                            # Push disabled, just dispatch (workflow may not find the file)
+                            dispatch_ok, dispatch_msg = self.maybe_dispatch_workflow(reason=f"webhook:{filename}")
+                            response_data['processing'] = {
+                                'mode': 'relay',
+                                'workflow_dispatch': {
+                                    'enabled': self.workflow_dispatch_enabled,
+                                    'success': dispatch_ok,
+                                    'message': dispatch_msg,
+                                }
+                            }
+            else:
+                response_data['git'] = {
+                    'enabled': False,
+                    'message': 'Git operations disabled in config'
+                }
+                logger.info("Git operations disabled, skipping commit")
+
+        return response_data
+
+    def enqueue_transcript(self, title: str, transcript_bytes: bytes, filename: str) -> bool:
+        """Queue a validated transcript for the workers. False when full."""
+        try:
+            self._webhook_queue.put_nowait((title, transcript_bytes, filename))
+        except queue.Full:
+            return False
+        return True
+
+    def start_webhook_workers(self) -> None:
+        if not self.queue_enabled or self._worker_threads:
+            return
+        for i in range(self.queue_workers):
+            t = threading.Thread(target=self._webhook_worker, name=f'webhook-worker-{i}', daemon=True)
+            t.start()
+            self._worker_threads.append(t)
+        logger.info("Started %s webhook worker(s) (queue maxsize=%s)", len(self._worker_threads), self.queue_maxsize)
+
+    def _webhook_worker(self) -> None:
+        while True:
+            title, transcript_bytes, filename = self._webhook_queue.get()
+            try:
+                self.maybe_sync_before_accept('queued-webhook')
+                # Defer the push while more items wait so back-to-back
+                # transcripts share one push.
+                defer = not self._webhook_queue.empty()
+                result = self.process_transcript_payload(title, transcript_bytes, filename, defer_push=defer)
+                if 'warning' in result:
+                    logger.warning("Queued webhook %s: %s", filename, result['warning'])
+            except Exception as e:
+                logger.error(f"Webhook worker error for {filename}: {e}")
+            finally:
+                self._webhook_queue.task_done()
+
+            if self._push_pending and self._webhook_queue.empty():
+                self._push_pending = False
+                with self._fs_lock:
+                    push_ok, push_msg = self.git_push()
+                    if not push_ok:
+                        logger.warning("Deferred push failed: %s", push_msg)
+
     def maybe_dispatch_workflow(self, *, reason: str) -> tuple[bool, str]:
         if not self.workflow_dispatch_enabled:
             return False, "workflow dispatch disabled"
@@ -367,11 +808,9 @@ class RepoAgent:
             return False, "GH_TOKEN not set"
 
         url = f"https://api.github.com/repos/{self.workflow_dispatch_repo}/actions/workflows/{self.workflow_dispatch_workflow}/dispatches"
-        headers = {
-            'Authorization': f'Bearer {token}',
-            'Accept': 'application/vnd.github+json',
-            'X-GitHub-Api-Version': '2022-11-28',
-        }
+        # Static Accept/API-version headers live on the session; only the
+        # token is per-call (it can change between dispatches).
+        headers = {'Authorization': f'Bearer {token}'}
         payload = {
             'ref': self.workflow_dispatch_ref,
             'inputs': dict(self.workflow_dispatch_inputs or {}),
@@ -380,7 +819,7 @@ class RepoAgent:
         # Note: we do not inject any implicit inputs; workflows may reject unknown inputs.
 
         try:
-            resp = requests.post(url, headers=headers, json=payload, timeout=20)
+            resp = self._http.post(url, headers=headers, json=payload, timeout=20)
         except Exception as e:
             return False, f"workflow dispatch failed: {e}"
 
@@ -397,18 +836,23 @@ class RepoAgent:
         except Exception:
             return False, f"File path is outside repository: {file_abs_path}"
 
-        # Stage file
-        result = self._run_git(['add', str(file_rel_path)], timeout=10)
-        if result.returncode != 0:
-            return False, f"Git add failed: {result.stderr.strip()}"
-        logger.info(f"Git added: {file_rel_path}")
-
-        # Commit
+        # Stage + commit in a single spawn from this process: one shell
+        # chains the two git commands instead of paying fork/exec twice
+        # on the webhook hot path. Arguments are passed positionally so
+        # titles never touch shell quoting.
         commit_message = self.git_commit_template.format(title=title)
-        result = self._run_git(['commit', '-m', commit_message], timeout=10)
+        with self._git_lock:
+            result = subprocess.run(
+                ['sh', '-c', 'git add -- "$1" && git commit -m "$2"', 'sh',
+                 str(file_rel_path), commit_message],
+                cwd=self._repo_path(),
+                capture_output=True,
+                text=True,
+                timeout=20,
+            )
         if result.returncode != 0:
-            return False, f"Git commit failed: {result.stderr.strip()}"
-        logger.info(f"Git committed: {commit_message}")
+            return False, f"Git add/commit failed: {result.stderr.strip()}"
+        logger.info("Git committed: %s (%s)", commit_message, file_rel_path)
 
         return True, "Committed to repository"
 
@@ -417,21 +861,35 @@ class RepoAgent:
         if not self.git_auto_push:
             return True, "Push disabled in config"
 
-        # Pull before push to avoid conflicts. Prefer ff-only semantics.
-        changed, message = self.sync_repo()
-        logger.info(f"Sync before push: {message}")
-        if changed and self.hook_on_new_commits_enabled:
-            ok, hook_msg = self._run_hook_on_new_commits()
-            if not ok:
-                logger.warning(hook_msg)
+        with self._git_lock:
+            # Optimistic push: the remote is usually already up to date, so
+            # try the push first and only pay the pull round trip when it is
+            # rejected as non-fast-forward.
+            push_args = ['push', str(self.git_remote), str(self.git_branch)]
+            result = self._run_git(push_args, timeout=60)
+            if result.returncode == 0:
+                logger.info("Git pushed to %s/%s", self.git_remote, self.git_branch)
+                return True, f"Pushed to {self.git_remote}/{self.git_branch}"
 
-        # Push (use configured remote/branch)
-        result = self._run_git(['push', str(self.git_remote), str(self.git_branch)], timeout=60)
-        if result.returncode != 0:
-            return False, f"Git push failed: {result.stderr.strip()}"
+            stderr = (result.stderr or '').strip()
+            if not ('non-fast-forward' in stderr or 'fetch first' in stderr or 'rejected' in stderr):
+                return False, f"Git push failed: {stderr}"
+
+            # Remote moved underneath us: reconcile (ff-only pull, same
+            # semantics as the old unconditional pre-push sync) and retry once.
+            changed, message = self.sync_repo()
+            logger.info("Sync after rejected push: %s", message)
+            if changed and self.hook_on_new_commits_enabled:
+                ok, hook_msg = self._run_hook_on_new_commits()
+                if not ok:
+                    logger.warning(hook_msg)
 
-        logger.info(f"Git pushed to {self.git_remote}/{self.git_branch}")
-        return True, f"Pushed to {self.git_remote}/{self.git_branch}"
+            result = self._run_git(push_args, timeout=60)
+            if result.returncode != 0:
+                return False, f"Git push failed: {result.stderr.strip()}"
+
+            logger.info("Git pushed to %s/%s (after sync retry)", self.git_remote, self.git_branch)
+            return True, f"Pushed to {self.git_remote}/{self.git_branch}"
 
     def start_background_sync(self) -> None:
         if not self.sync_enabled or self.sync_poll_interval_seconds <= 0:
@@ -441,20 +899,20 @@ class RepoAgent:
             return
 
         def _loop():
-            logger.info(f"Background sync started (interval={self.sync_poll_interval_seconds}s)")
+            logger.info("Background sync started (interval=%ss)", self.sync_poll_interval_seconds)
             while not self._stop_event.is_set():
                 try:
-                    with self._lock:
+                    with self._git_lock:
                         changed, message = self.sync_repo()
                         if changed:
-                            logger.info(f"Background sync: {message}")
+                            logger.info("Background sync: %s", message)
                             ok, hook_msg = self._run_hook_on_new_commits()
                             if not ok:
                                 logger.warning(hook_msg)
                         else:
-                            logger.debug(f"Background sync: {message}")
+                            logger.debug("Background sync: %s", message)
                 except Exception as e:
-                    logger.warning(f"Background sync error: {e}")
+                    logger.warning("Background sync error: %s", e)
                 self._stop_event.wait(self.sync_poll_interval_seconds)
 
         self._sync_thread = threading.Thread(target=_loop, name='repo-sync', daemon=True)
@@ -468,10 +926,16 @@ config = load_config()
 agent = RepoAgent(config)
 
 
+# Precompiled patterns for sanitize_filename (called per webhook).
+_WHITESPACE_RE = re.compile(r'\s+')
+_UNSAFE_CHAR_RE = re.compile(r'[^a-z0-9\-_]')
+_MULTI_HYPHEN_RE = re.compile(r'-+')
+
+
 def sanitize_filename(title):
     """
     Sanitize the title to create a safe filename.
-    
+
     - Convert to lowercase
     - Replace spaces with hyphens
     - Remove special characters
@@ -479,13 +943,13 @@ def sanitize_filename(title):
     """
     # Convert to lowercase and replace spaces with hyphens
     sanitized = title.lower().strip()
-    sanitized = re.sub(r'\s+', '-', sanitized)
-    
+    sanitized = _WHITESPACE_RE.sub('-', sanitized)
+
     # Remove any character that isn't alphanumeric, hyphen, or underscore
-    sanitized = re.sub(r'[^a-z0-9\-_]', '', sanitized)
-    
+    sanitized = _UNSAFE_CHAR_RE.sub('', sanitized)
+
     # Remove multiple consecutive hyphens
-    sanitized = re.sub(r'-+', '-', sanitized)
+    sanitized = _MULTI_HYPHEN_RE.sub('-', sanitized)
     
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip('-')
@@ -502,21 +966,20 @@ def sanitize_filename(title):
     return sanitized
 
 
-def _build_transcript_header(data: dict, transcript: str) -> str:
-    """Build a YAML front matter header and prepend it to the transcript.
-    
+def _build_header_block(data: dict) -> str:
+    """Build the YAML front matter block for a transcript.
+
     Uses timing fields from the webhook payload if available,
     otherwise falls back to the receipt timestamp.
-    
+
     Args:
         data: The webhook JSON payload (may contain meeting_start, meeting_end, duration, recording_source)
-        transcript: The raw transcript text
-    
+
     Returns:
-        Transcript with YAML front matter prepended
+        The front matter block, including both '---' delimiters
     """
     now = datetime.now().astimezone()
-    header = {}
+    now_iso = now.isoformat()
 
     # Extract timing fields from payload
     meeting_start = data.get('meeting_start') or data.get('start_time')
@@ -524,39 +987,51 @@ def _build_transcript_header(data: dict, transcript: str) -> str:
     duration = data.get('duration')  # seconds
     source = data.get('recording_source', 'macwhisper')
 
-    if meeting_start:
-        header['meeting_start'] = meeting_start
-    if meeting_end:
-        header['meeting_end'] = meeting_end
-
     # If we have duration but are missing start/end, estimate
     if duration and not meeting_start and not meeting_end:
-        end = now
-        start = now - timedelta(seconds=int(duration))
-        header['meeting_start'] = start.isoformat()
-        header['meeting_end'] = end.isoformat()
+        meeting_start = (now - timedelta(seconds=int(duration))).isoformat()
+        meeting_end = now_iso
     elif duration and meeting_start and not meeting_end:
         try:
             start_dt = datetime.fromisoformat(meeting_start)
-            header['meeting_end'] = (start_dt + timedelta(seconds=int(duration))).isoformat()
+            meeting_end = (start_dt + timedelta(seconds=int(duration))).isoformat()
         except (ValueError, TypeError):
             pass
 
     # If we still have nothing, use receipt time as meeting_end
-    if 'meeting_start' not in header and 'meeting_end' not in header:
-        header['meeting_end'] = now.isoformat()
+    if not meeting_start and not meeting_end:
+        meeting_end = now_iso
 
-    header['recording_source'] = source
-    header['received_at'] = now.isoformat()
+    # Assemble the front matter in one f-string; the field set is fixed,
+    # so there is no need for intermediate dict/list builds.
+    start_line = f'meeting_start: {meeting_start}\n' if meeting_start else ''
+    end_line = f'meeting_end: {meeting_end}\n' if meeting_end else ''
+    return (
+        f'---\n{start_line}{end_line}'
+        f'recording_source: {source}\nreceived_at: {now_iso}\n---\n'
+    )
 
-    # Build YAML front matter
-    lines = ['---']
-    for key, value in header.items():
-        lines.append(f'{key}: {value}')
-    lines.append('---')
-    lines.append('')
 
-    return '\n'.join(lines) + transcript
+def _build_transcript_header(data: dict, transcript: str) -> str:
+    """Prepend a YAML front matter header to the transcript."""
+    return _build_header_block(data) + transcript
+
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    """Write bytes to path atomically: tmp file + rename.
+
+    Git (and the standalone processor scanning the inbox) never sees a
+    partially written file. No fsync: the content is committed to git
+    (and pushed) immediately after, which reads through the page cache
+    and gives the real durability guarantee.
+    """
+    tmp_path = path + '.tmp'
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
 
 
 def generate_filename(title):
@@ -572,33 +1047,7 @@ def generate_filename(title):
 @app.route('/', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    processing_mode = 'standalone' if agent.standalone_enabled else 'relay'
-    return jsonify({
-        'status': 'ok',
-        'service': 'meetingnotesd',
-        'inbox_dir': agent.inbox_dir,
-        'repository': agent.repo_dir,
-        'port': agent.port,
-        'endpoints': {
-            'health': '/',
-            'transcript': '/webhook',
-            'calendar': '/calendar',
-        },
-        'processing_mode': processing_mode,
-        'sync': {
-            'enabled': agent.sync_enabled,
-            'poll_interval_seconds': agent.sync_poll_interval_seconds,
-        },
-        'standalone': {
-            'enabled': agent.standalone_enabled,
-            'command': agent.standalone_command if agent.standalone_enabled else None,
-        },
-        'relay': {
-            'workflow_dispatch_enabled': agent.workflow_dispatch_enabled,
-            'repo': agent.workflow_dispatch_repo if agent.workflow_dispatch_enabled else None,
-            'workflow': agent.workflow_dispatch_workflow if agent.workflow_dispatch_enabled else None,
-        },
-    }), 200
+    return jsonify(agent.health_payload), 200
 
 
 @app.route('/calendar', methods=['POST'])
@@ -615,7 +1064,9 @@ def calendar():
     Or plain text with Content-Type: text/plain
     """
     try:
-        # Accept either JSON or plain text
+        # Accept either JSON or plain text. Work with bytes throughout so
+        # a 1MB payload isn't decoded and re-encoded just to be measured
+        # and written back out.
         if request.is_json:
             data = request.get_json()
             if 'calendar' not in data:
@@ -623,16 +1074,16 @@ def calendar():
                     'status': 'error',
                     'message': "Missing required field: 'calendar'"
                 }), 400
-            calendar_content = data['calendar']
+            calendar_bytes = data['calendar'].encode('utf-8')
         elif request.content_type and 'text/plain' in request.content_type:
-            calendar_content = request.get_data(as_text=True)
+            calendar_bytes = request.get_data()
         else:
             return jsonify({
                 'status': 'error',
                 'message': 'Content-Type must be application/json or text/plain'
             }), 400
 
-        if not calendar_content or not calendar_content.strip():
+        if not calendar_bytes or not calendar_bytes.strip():
             return jsonify({
                 'status': 'error',
                 'message': 'Calendar content cannot be empty'
@@ -640,28 +1091,23 @@ def calendar():
 
         # Size limit: 1MB should be plenty for a calendar file
         MAX_CALENDAR_SIZE = 1024 * 1024
-        content_size = len(calendar_content.encode('utf-8'))
+        content_size = len(calendar_bytes)
         if content_size > MAX_CALENDAR_SIZE:
             return jsonify({
                 'status': 'error',
                 'message': f'Calendar too large ({content_size} bytes). Maximum size is {MAX_CALENDAR_SIZE} bytes.'
             }), 413
 
-        with agent._lock:
-            # Sync before writing
-            if agent.sync_enabled and agent.sync_before_accepting_webhooks:
-                try:
-                    changed, msg = agent.sync_repo()
-                    logger.info(f"Pre-calendar sync: {msg}")
-                except Exception as e:
-                    logger.warning(f"Pre-calendar sync failed: {e}")
+        # Sync before writing (skipped when a recent sync covers us;
+        # no hook — calendar updates don't feed the on-new-commits hook)
+        agent.maybe_sync_before_accept('calendar', run_hook=False)
 
+        with agent._fs_lock:
             # Write calendar.org
-            calendar_path = os.path.join(agent.repo_dir, 'calendar.org')
-            with open(calendar_path, 'w', encoding='utf-8') as f:
-                f.write(calendar_content)
+            calendar_path = agent.calendar_path
+            _atomic_write_bytes(calendar_path, calendar_bytes)
 
-            logger.info(f"Updated calendar: {calendar_path} ({content_size} bytes)")
+            logger.info("Updated calendar: %s (%s bytes)", calendar_path, content_size)
 
             response_data = {
                 'status': 'success',
@@ -688,7 +1134,10 @@ def calendar():
         return jsonify(response_data), 200
 
     except Exception as e:
-        logger.error(f"Error processing calendar: {str(e)}", exc_info=True)
+        # Full traceback only at DEBUG: stringifying stacks for every
+        # error from a misbehaving client is expensive and noisy.
+        logger.error("Error processing calendar: %s", e)
+        logger.debug("calendar traceback", exc_info=True)
         return jsonify({
             'status': 'error',
             'message': f'Internal server error: {str(e)}'
@@ -717,7 +1166,7 @@ def webhook():
     try:
         # Validate content type
         if not request.is_json:
-            logger.warning(f"Invalid content type: {request.content_type}")
+            logger.warning("Invalid content type: %s", request.content_type)
             return jsonify({
                 'status': 'error',
                 'message': 'Content-Type must be application/json'
@@ -746,152 +1195,69 @@ def webhook():
 
         # Validate that transcript has content
         if not transcript or not transcript.strip():
-            logger.warning(f"Empty transcript received for title: {title}")
+            logger.warning("Empty transcript received for title: %s", title)
             return jsonify({
                 'status': 'error',
                 'message': 'Transcript cannot be empty'
             }), 400
 
-        # Inject YAML front matter if not already present
+        # Fast rejection before any encoding work: UTF-8 is at least one
+        # byte per character, so an over-limit character count can never
+        # fit the byte limit checked below.
+        MAX_TRANSCRIPT_SIZE = 256 * 1024  # 256 KB
+        if len(transcript) > MAX_TRANSCRIPT_SIZE:
+            logger.warning("Transcript too large (%s chars) for title: %s", len(transcript), title)
+            return jsonify({
+                'status': 'error',
+                'message': f'Transcript too large ({len(transcript)} chars). Maximum size is {MAX_TRANSCRIPT_SIZE} bytes (256KB).'
+            }), 413  # 413 Payload Too Large
+
+        # Encode the body once; if front matter is missing, encode just
+        # the small header block and join bytes rather than building and
+        # re-encoding a full-size combined string.
+        transcript_bytes = transcript.encode('utf-8')
         if not transcript.lstrip().startswith('---'):
-            transcript = _build_transcript_header(data, transcript)
+            transcript_bytes = _build_header_block(data).encode('utf-8') + transcript_bytes
 
-        # Validate transcript size (256KB limit - covers very long meetings)
-        MAX_TRANSCRIPT_SIZE = 256 * 1024  # 256 KB
-        transcript_size = len(transcript.encode('utf-8'))
+        # Validate transcript size (256KB limit - covers very long meetings).
+        transcript_size = len(transcript_bytes)
         if transcript_size > MAX_TRANSCRIPT_SIZE:
-            logger.warning(f"Transcript too large ({transcript_size} bytes) for title: {title}")
+            logger.warning("Transcript too large (%s bytes) for title: %s", transcript_size, title)
             return jsonify({
                 'status': 'error',
                 'message': f'Transcript too large ({transcript_size} bytes). Maximum size is {MAX_TRANSCRIPT_SIZE} bytes (256KB).'
             }), 413  # 413 Payload Too Large
 
-        with agent._lock:
-            # Optional sync before accepting new work
-            if agent.sync_enabled and agent.sync_before_accepting_webhooks:
-                try:
-                    changed, msg = agent.sync_repo()
-                    logger.info(f"Pre-webhook sync: {msg}")
-                    if changed:
-                        ok, hook_msg = agent._run_hook_on_new_commits()
-                        if not ok:
-                            logger.warning(hook_msg)
-                except Exception as e:
-                    logger.warning(f"Pre-webhook sync failed: {e}")
-
-            # Generate filename
-            filename = generate_filename(title)
-            filepath = os.path.join(agent.inbox_dir, filename)
+        # Generate filename
+        filename = generate_filename(title)
 
-            # Ensure inbox directory exists
-            os.makedirs(agent.inbox_dir, exist_ok=True)
-
-            # Write transcript to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(transcript)
-
-            logger.info(f"Successfully wrote transcript to: {filepath}")
-
-            response_data = {
-                'status': 'success',
+        # Queued mode: hand the validated payload to the workers and
+        # return immediately so MacWhisper's connection isn't held open
+        # across git/processing work.
+        if agent.queue_enabled:
+            if not agent.enqueue_transcript(title, transcript_bytes, filename):
+                return jsonify({
+                    'status': 'error',
+                    'message': 'Webhook queue is full, try again later'
+                }), 503
+            return jsonify({
+                'status': 'accepted',
                 'filename': filename,
                 'message': 'Transcript queued for processing'
-            }
-
-            # Commit and push to git if enabled
-            if agent.git_auto_commit:
-                logger.info("Initiating git commit...")
-                # Ensure repo exists before committing
-                if agent.sync_enabled:
-                    agent.ensure_repo_checkout()
+            }), 202
 
-                commit_ok, commit_msg = agent.git_commit(filepath, title)
-                response_data['git'] = {
-                    'enabled': True,
-                    'committed': commit_ok,
-                    'message': commit_msg
-                }
+        # Optional sync before accepting new work (skipped when the
+        # background poll just pulled — no point paying the round trip
+        # on the request path)
+        agent.maybe_sync_before_accept('webhook')
 
-                if not commit_ok:
-                    # File was saved but git failed - still return success with warning
-                    response_data['warning'] = 'File saved but git commit failed'
-                    logger.warning(f"Git commit failed but file was saved: {commit_msg}")
-                else:
-                    # Choose processing mode: standalone (local) or relay (workflow dispatch)
-                    if agent.standalone_enabled:
-                        if agent.standalone_async:
-                            # Async mode: return immediately, process in background
-                            agent.run_standalone_processing_async()
-                            response_data['processing'] = {
-                                'mode': 'standalone',
-                                'async': True,
-                                'message': 'Processing started in background',
-                            }
-                        else:
-                            # Sync mode: wait for processing to complete
-                            proc_ok, proc_msg = agent.run_standalone_processing()
-                            response_data['processing'] = {
-                                'mode': 'standalone',
-                                'async': False,
-                                'success': proc_ok,
-                                'message': proc_msg,
-                            }
-                            # Push all commits (inbox + processing results) together
-                            if proc_ok and agent.git_auto_push:
-                                push_ok, push_msg = agent.git_push()
-                                response_data['git']['pushed'] = push_ok
-                                response_data['git']['push_message'] = push_msg
-                                if not push_ok:
-                                    logger.warning(f"Push after standalone processing failed: {push_msg}")
-                    else:
-                        # Relay mode: push immediately so GitHub Actions can access the file
-                        if agent.git_auto_push:
-                            push_ok, push_msg = agent.git_push()
-                            response_data['git']['pushed'] = push_ok
-                            response_data['git']['push_message'] = push_msg
-                            if not push_ok:
-                                logger.warning(f"Push failed: {push_msg}")
-                                # Don't dispatch workflow if push failed
-                                response_data['processing'] = {
-                                    'mode': 'relay',
-                                    'workflow_dispatch': {
-                                        'enabled': agent.workflow_dispatch_enabled,
-                                        'success': False,
-                                        'message': 'Skipped: push failed',
-                                    }
-                                }
-                            else:
-                                dispatch_ok, dispatch_msg = agent.maybe_dispatch_workflow(reason=f"webhook:{filename}")
-                                response_data['processing'] = {
-                                    'mode': 'relay',
-                                    'workflow_dispatch': {
-                                        'enabled': agent.workflow_dispatch_enabled,
-                                        'success': dispatch_ok,
-                                        'message': dispatch_msg,
-                                    }
-                                }
-                        else:
-                            # Push disabled, just dispatch (workflow may not find the file)
-                            dispatch_ok, dispatch_msg = agent.maybe_dispatch_workflow(reason=f"webhook:{filename}")
-                            response_data['processing'] = {
-                                'mode': 'relay',
-                                'workflow_dispatch': {
-                                    'enabled': agent.workflow_dispatch_enabled,
-                                    'success': dispatch_ok,
-                                    'message': dispatch_msg,
-                                }
-                            }
-            else:
-                response_data['git'] = {
-                    'enabled': False,
-                    'message': 'Git operations disabled in config'
-                }
-                logger.info("Git operations disabled, skipping commit")
+        response_data = agent.process_transcript_payload(title, transcript_bytes, filename)
 
         return jsonify(response_data), 200
 
     except Exception as e:
-        logger.error(f"Error processing webhook: {str(e)}", exc_info=True)
+        logger.error("Error processing webhook: %s", e)
+        logger.debug("webhook traceback", exc_info=True)
         return jsonify({
             'status': 'error',
             'message': f'Internal server error: {str(e)}'
@@ -902,30 +1268,31 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Meeting Notes Daemon (meetingnotesd)')
     parser.add_argument('--sync-once', action='store_true', help='Run repo bootstrap/sync once and exit')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('--threads', type=int, default=8, help='WSGI server worker threads (waitress)')
     args = parser.parse_args()
 
     # Configure logging based on --debug flag
     logging.getLogger().setLevel(logging.DEBUG if args.debug else logging.INFO)
 
-    logger.info(f"Starting meetingnotesd on {agent.host}:{agent.port}")
-    logger.info(f"Inbox directory: {agent.inbox_dir}")
-    logger.info(f"Repository: {agent.repo_dir}")
-    logger.info(f"Health check: http://{agent.host}:{agent.port}/")
-    logger.info(f"Transcript webhook: http://{agent.host}:{agent.port}/webhook")
-    logger.info(f"Calendar webhook: http://{agent.host}:{agent.port}/calendar")
+    logger.info("Starting meetingnotesd on %s:%s", agent.host, agent.port)
+    logger.info("Inbox directory: %s", agent.inbox_dir)
+    logger.info("Repository: %s", agent.repo_dir)
+    logger.info("Health check: http://%s:%s/", agent.host, agent.port)
+    logger.info("Transcript webhook: http://%s:%s/webhook", agent.host, agent.port)
+    logger.info("Calendar webhook: http://%s:%s/calendar", agent.host, agent.port)
 
     # Ensure repo checkout + initial sync
     if agent.sync_enabled and agent.sync_on_startup:
-        with agent._lock:
+        with agent._git_lock:
             try:
                 changed, msg = agent.sync_repo()
-                logger.info(f"Startup sync: {msg}")
+                logger.info("Startup sync: %s", msg)
                 if changed:
                     ok, hook_msg = agent._run_hook_on_new_commits()
                     if not ok:
                         logger.warning(hook_msg)
             except Exception as e:
-                logger.warning(f"Startup sync failed: {e}")
+                logger.warning("Startup sync failed: %s", e)
 
     # Ensure inbox directory exists (might be inside a freshly-cloned repo)
     os.makedirs(agent.inbox_dir, exist_ok=True)
@@ -935,4 +1302,19 @@ if __name__ == '__main__':
         raise SystemExit(0)
 
     agent.start_background_sync()
-    app.run(host=agent.host, port=agent.port, debug=False)
+    agent.start_webhook_workers()
+
+    # Prefer waitress: Flask's built-in server is single-threaded, so one
+    # slow webhook would block every other request (including health
+    # checks) for its whole duration.
+    try:
+        from waitress import serve as waitress_serve
+    except ImportError:
+        waitress_serve = None
+
+    if waitress_serve is not None:
+        logger.info("Serving with waitress (%s threads)", args.threads)
+        waitress_serve(app, host=agent.host, port=agent.port, threads=args.threads)
+    else:
+        logger.warning("waitress not installed; falling back to Flask dev server (threaded)")
+        app.run(host=agent.host, port=agent.port, debug=False, threaded=True)
@@ -15,15 +15,25 @@ Supports --workspace argument (or WORKSPACE_DIR env var) for running against a s
 """
 
 import subprocess
+import functools
+from collections import deque
 import os
 import argparse
 import sys
-import glob
+import hashlib
+import heapq
 import json
+import mmap
+import pickle
+import sqlite3
+import urllib.error
+import urllib.request
+import itertools
+import threading
 import time as _time
-import uuid
 import select
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 import shutil
 import re
@@ -34,39 +44,128 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Copilot executable path - override with COPILOT_PATH env var for systemd/non-PATH contexts
 COPILOT_PATH = os.environ.get('COPILOT_PATH', 'copilot')
 
+# LLM response cache directory - override with LLM_CACHE_DIR env var (e.g. for tests)
+LLM_CACHE_DIR = os.environ.get(
+    'LLM_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'meeting-notes-processor'))
+
+
+# ============================================================================
+# LLM Response Cache
+# ============================================================================
+# Calendar matching and multi-meeting detection send deterministic prompts and
+# expect a single JSON object back. Re-running the script over the same files
+# (common during development and reprocessing) repeats identical subprocess
+# calls that each cost seconds of wall time and API spend. Cache parsed
+# responses on disk, keyed by a hash of (model, prompt).
+# ============================================================================
+
+def _llm_cache_connect() -> sqlite3.Connection:
+    """Open (creating if needed) the on-disk LLM response cache."""
+    os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(LLM_CACHE_DIR, 'llm-cache.sqlite'))
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS cache ('
+        'key TEXT PRIMARY KEY, json_result TEXT, created_at REAL)')
+    return conn
+
+
+def _llm_cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f'{model}\x00{prompt}'.encode('utf-8')).hexdigest()
+
+
+def llm_cache_get(model: str, prompt: str) -> dict | None:
+    """Return the cached parsed response for (model, prompt), or None on miss."""
+    try:
+        conn = _llm_cache_connect()
+        try:
+            row = conn.execute(
+                'SELECT json_result FROM cache WHERE key = ?',
+                (_llm_cache_key(model, prompt),)).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return None  # Cache is best-effort; never fail the caller
+    if not row:
+        return None
+    try:
+        return json.loads(row[0])
+    except json.JSONDecodeError:
+        return None
+
+
+def llm_cache_put(model: str, prompt: str, result: dict) -> None:
+    """Store a parsed LLM response. Failures are silently ignored."""
+    try:
+        conn = _llm_cache_connect()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO cache (key, json_result, created_at) VALUES (?, ?, ?)',
+                (_llm_cache_key(model, prompt), json.dumps(result), _time.time()))
+            conn.commit()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass
+
 
 def get_workspace_paths(workspace_dir: str) -> dict:
     """Compute all workspace-relative paths."""
     return {
         'workspace': workspace_dir,
+        # abspath hits getcwd(); resolve once so per-file loops can reuse it
+        'workspace_abs': os.path.abspath(workspace_dir),
         'inbox': os.path.join(workspace_dir, 'inbox'),
         'transcripts': os.path.join(workspace_dir, 'transcripts'),
         'notes': os.path.join(workspace_dir, 'notes'),
     }
 
 
+_default_prompt_file_cache: dict[str, str] = {}
+
+
 def get_default_prompt_file(workspace_dir: str) -> str:
     """Return the default prompt file path, preferring workspace over script directory."""
+    cached = _default_prompt_file_cache.get(workspace_dir)
+    if cached is not None:
+        return cached
     workspace_prompt = os.path.join(workspace_dir, 'prompt.txt')
     if os.path.exists(workspace_prompt):
-        return workspace_prompt
-    return os.path.join(SCRIPT_DIR, 'prompt.txt')
+        result = workspace_prompt
+    else:
+        result = os.path.join(SCRIPT_DIR, 'prompt.txt')
+    _default_prompt_file_cache[workspace_dir] = result
+    return result
+
+
+_prompt_cache: dict[tuple[str, int, int], str] = {}
 
 
 def load_prompt_template(prompt_file: str | None, workspace_dir: str) -> str:
-    """Load the prompt template from a file.
-    
+    """Load the prompt template from a file, caching by path and mtime.
+
     If prompt_file is None, uses get_default_prompt_file() to find the default.
+    The template is reused across transcripts in a run, so repeat reads hit an
+    in-process cache invalidated when the file changes on disk.
     """
     if prompt_file is None:
         prompt_file = get_default_prompt_file(workspace_dir)
-    
-    if not os.path.exists(prompt_file):
+
+    try:
+        st = os.stat(prompt_file)
+    except OSError:
         print(f"Error: Prompt file not found: {prompt_file}")
         sys.exit(1)
-    
+
+    cache_key = (prompt_file, st.st_mtime_ns, st.st_size)
+    cached = _prompt_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     with open(prompt_file, 'r', encoding='utf-8') as f:
-        return f.read()
+        content = f.read()
+    _prompt_cache[cache_key] = content
+    return content
 
 
 def format_calendar_for_prompt(calendar_entries: list[dict], meeting_date: str) -> str:
@@ -74,23 +173,19 @@ def format_calendar_for_prompt(calendar_entries: list[dict], meeting_date: str)
     if not calendar_entries:
         return "No calendar entries found for this date."
     
-    lines = []
+    parts = []
     for i, e in enumerate(calendar_entries, 1):
         time_str = f"{e['start_time']}-{e['end_time']}" if e['start_time'] else "all-day"
         participants = ', '.join(e['participants']) if e['participants'] else 'unknown'
-        lines.append(f"{i}. [{time_str}] {e['title']}")
-        lines.append(f"   Participants: {participants}")
-        if e['meeting_links']:
-            lines.append(f"   Meeting link: {e['meeting_links'][0]}")
-        lines.append("")
-    
-    return '\n'.join(lines)
+        link = f"\n   Meeting link: {e['meeting_links'][0]}" if e['meeting_links'] else ""
+        parts.append(f"{i}. [{time_str}] {e['title']}\n   Participants: {participants}{link}\n")
 
+    return '\n'.join(parts)
 
-def build_calendar_aware_prompt(base_prompt: str, calendar_text: str, meeting_date: str, notes_context: str = "") -> str:
-    """Build a combined prompt that includes calendar context for single-pass processing."""
-    
-    calendar_instructions = f"""
+
+# Static calendar-instruction text, built once at import. Formatting the
+# placeholders is far cheaper than rebuilding the ~3 KB literal per call.
+_CAL_PROMPT_TEMPLATE = """
 ## CALENDAR CONTEXT FOR {meeting_date}
 
 You have access to the user's calendar for this date. Use this to:
@@ -153,25 +248,42 @@ If you match to a calendar entry, add these properties to the :PROPERTIES: drawe
 ## END CALENDAR CONTEXT
 
 """
-    
+
+
+def build_calendar_aware_prompt(base_prompt: str, calendar_text: str, meeting_date: str, notes_context: str = "") -> str:
+    """Build a combined prompt that includes calendar context for single-pass processing."""
     # Insert calendar instructions before the base prompt
-    return calendar_instructions + base_prompt
+    return _CAL_PROMPT_TEMPLATE.format(
+        meeting_date=meeting_date,
+        calendar_text=calendar_text,
+        notes_context=notes_context,
+    ) + base_prompt
+
+
+# Compiled once: these run per org/inbox file during batch processing.
+_SLUG_RE = re.compile(r':SLUG:\s+([a-z0-9-]+)', re.IGNORECASE)
+_DATE_PREFIX_RE = re.compile(r'^(\d{8})-')
 
 
 def extract_slug_from_org(org_file_path):
     """Extract the slug from the org file's property drawer."""
     try:
+        # The :PROPERTIES: drawer sits at the top of the file — a bounded
+        # header read avoids slurping the whole summary. Only fall back to
+        # a full read if the drawer hasn't closed within the peek window.
         with open(org_file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Look for :SLUG: property in the property drawer
-        match = re.search(r':SLUG:\s+([a-z0-9-]+)', content, re.IGNORECASE)
+            content = f.read(4096)
+            match = _SLUG_RE.search(content)
+            if not match and ':END:' not in content:
+                content += f.read()
+                match = _SLUG_RE.search(content)
         if match:
-            slug = match.group(1).lower().strip()
-            # Ensure it's valid and reasonable length
-            if slug and len(slug) <= 50 and re.match(r'^[a-z0-9-]+$', slug):
+            # The capture class already limits chars to [a-z0-9-], so
+            # lowering the match is the only validation left besides length
+            slug = match.group(1).lower()
+            if slug and len(slug) <= 50:
                 return slug
-        
+
         # Fallback to 'meeting' if no valid slug found
         print("  Warning: No valid slug found in org file, using 'meeting'")
         return 'meeting'
@@ -181,42 +293,55 @@ def extract_slug_from_org(org_file_path):
 
 def get_date_from_file(filepath):
     """Extract date from filename if present (YYYYMMDD-), otherwise from mtime."""
-    import re
     filename = os.path.basename(filepath)
     # Check for YYYYMMDD pattern at start of filename
-    match = re.match(r'^(\d{8})-', filename)
+    match = _DATE_PREFIX_RE.match(filename)
     if match:
         return match.group(1)
     # Fall back to file modification time
     timestamp = os.path.getmtime(filepath)
     return datetime.fromtimestamp(timestamp).strftime('%Y%m%d')
 
-def parse_transcript_header(filepath: str) -> dict:
-    """Extract YAML front matter from transcript if present.
-    
+# Closing delimiter of YAML front matter (searched from offset 3, past
+# the opening '---', so absolute match positions need no adjustment)
+_FRONT_MATTER_END_RE = re.compile(r'\n---\s*\n')
+
+
+def read_transcript(filepath: str) -> tuple[dict, str]:
+    """Read a transcript once, returning (metadata, body).
+
     Expected format:
         ---
         meeting_start: 2026-01-27T14:00:00-08:00
         meeting_end: 2026-01-27T15:03:00-08:00
         recording_source: transcriber
         ---
-        
+
         [Transcript content follows...]
-    
-    Returns a dict of parsed fields, or empty dict if no header present.
+
+    Splits the optional YAML front matter from the body in a single read
+    and scan. parse_transcript_header / get_transcript_body are thin
+    wrappers for callers that only need one half; callers that need both
+    should use this directly so the file isn't read twice.
     """
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
-    
+
     if not content.startswith('---'):
-        return {}
-    
-    # Find closing ---
-    end_match = re.search(r'\n---\s*\n', content[3:])
+        return {}, content
+
+    # Find closing --- (search from offset 3 to avoid copying the content)
+    end_match = _FRONT_MATTER_END_RE.search(content, 3)
     if not end_match:
-        return {}
-    
-    yaml_text = content[3:3 + end_match.start()]
+        return {}, content
+
+    yaml_text = content[3:end_match.start()]
+    body = content[end_match.end():]
+    return _parse_front_matter(yaml_text), body
+
+
+def _parse_front_matter(yaml_text: str) -> dict:
+    """Parse a YAML front matter block, normalizing timestamp fields."""
     try:
         import yaml
         metadata = yaml.safe_load(yaml_text) or {}
@@ -224,25 +349,73 @@ def parse_transcript_header(filepath: str) -> dict:
         for key in ('meeting_start', 'meeting_end'):
             if key in metadata and not isinstance(metadata[key], str):
                 metadata[key] = metadata[key].isoformat()
+        # Parse the timestamps once; every downstream consumer (junk
+        # filter, multi-meeting detection, split) wants the datetime form
+        for key in ('meeting_start', 'meeting_end'):
+            value = metadata.get(key)
+            if value:
+                try:
+                    metadata[f'_{key}_dt'] = datetime.fromisoformat(value)
+                except (ValueError, TypeError):
+                    pass
         return metadata
     except Exception:
         return {}
 
 
-def get_transcript_body(filepath: str) -> str:
-    """Return the transcript text with YAML front matter stripped, if present."""
+# Front matter lives in the first few hundred bytes; header-only callers
+# read this much instead of pulling a multi-MB transcript into memory.
+_HEADER_PEEK_BYTES = 8192
+
+
+def parse_transcript_header(filepath: str) -> dict:
+    """Extract YAML front matter from transcript if present.
+
+    Returns a dict of parsed fields, or empty dict if no header present.
+    Reads only the head of the file — use read_transcript when the body
+    is needed too.
+    """
     with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    if not content.startswith('---'):
-        return content
-    
-    end_match = re.search(r'\n---\s*\n', content[3:])
+        head = f.read(_HEADER_PEEK_BYTES)
+
+    if not head.startswith('---'):
+        return {}
+
+    end_match = _FRONT_MATTER_END_RE.search(head, 3)
     if not end_match:
-        return content
-    
-    # Return everything after the closing ---
-    return content[3 + end_match.end():]
+        # Either no closing delimiter at all, or a header larger than the
+        # peek window (never seen in practice) — fall back to a full read.
+        if len(head) == _HEADER_PEEK_BYTES:
+            return read_transcript(filepath)[0]
+        return {}
+
+    return _parse_front_matter(head[3:end_match.start()])
+
+
+def get_transcript_body(filepath: str) -> str:
+    """Return the transcript text with YAML front matter stripped, if present."""
+    return read_transcript(filepath)[1]
+
+
+@functools.lru_cache(maxsize=256)
+def _load_transcript(filepath: str, mtime_ns: int) -> tuple[dict, str]:
+    return read_transcript(filepath)
+
+
+def read_transcript_cached(filepath: str) -> tuple[dict, str]:
+    """read_transcript memoized on (path, mtime).
+
+    The pre-processing stages (junk filter, multi-meeting detection,
+    split) run back-to-back on the same file; this collapses their
+    repeated reads and front-matter parses into one. Edits on disk
+    invalidate via the mtime component of the key. Callers must not
+    mutate the returned metadata dict.
+    """
+    try:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return read_transcript(filepath)
+    return _load_transcript(filepath, mtime_ns)
 
 
 # ============================================================================
@@ -261,82 +434,252 @@ MULTI_MEETING_MIN_BODY = 5000
 # Minimum duration to consider checking for multi-meeting (seconds)
 MULTI_MEETING_MIN_DURATION = 3600  # 60 minutes
 
+# Lexical gate before the multi-meeting LLM call: a genuine back-to-back
+# recording contains meeting-ending language followed by meeting-starting
+# language, so require repeated occurrences of each before paying for the
+# LLM. Counted with str.count (a C substring scan) on the lowercased body.
+_FAREWELL_TOKENS = ('bye', 'take care', 'talk to you later', 'see you')
+_GREETING_TOKENS = ('hello', 'hi there', 'good morning', 'how are you')
+
 
 def _extract_json_object(text: str) -> dict | None:
-    """Extract the first valid JSON object from text, handling nested braces."""
-    for i, ch in enumerate(text):
-        if ch == '{':
-            depth = 0
-            for j in range(i, len(text)):
-                if text[j] == '{':
-                    depth += 1
-                elif text[j] == '}':
-                    depth -= 1
-                    if depth == 0:
-                        try:
-                            return json.loads(text[i:j+1])
-                        except json.JSONDecodeError:
-                            break  # malformed, try next '{'
+    """Extract the first valid JSON object from text, handling nested braces.
+
+    Single forward scan tracking brace depth, aware of string literals so
+    braces (and escaped quotes) inside strings don't unbalance the count.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if start < 0:
+            if ch == '{':
+                start = i
+                depth = 1
+        elif in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                try:
+                    return json.loads(text[start:i+1])
+                except json.JSONDecodeError:
+                    # Malformed — resume the search after the opening brace
+                    i = start
+                    start = -1
+                    in_string = False
+                    escape = False
+        i += 1
     return None
 
 
+def _run_json_subprocess(command: list[str], timeout: int) -> tuple[dict | None, str]:
+    """Run an LLM command whose useful output is a single JSON object.
+
+    Streams stdout line by line (like debug_copilot.py) instead of waiting
+    for the process to exit: the CLI often keeps printing stats or trailing
+    prose after the JSON object is complete, so the process is terminated
+    as soon as a balanced object parses.
+
+    Returns (parsed_object, error_detail); the object is None on failure.
+    Raises subprocess.TimeoutExpired when the deadline passes.
+
+    Output is read as non-blocking byte chunks (the same shape as
+    _stream_subprocess_output: select signals bytes, not lines, and a
+    blocking readline on a stalled partial line would outlive the
+    deadline) and decoded only when a closing brace makes a complete
+    object possible. stderr is merged into stdout so a chatty CLI can
+    never fill the stderr pipe and deadlock.
+    """
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+    )
+    stdout_fd = process.stdout.fileno()
+    os.set_blocking(stdout_fd, False)
+    deadline = _time.monotonic() + timeout
+    output_parts = []
+    try:
+        while process.poll() is None:
+            remaining = deadline - _time.monotonic()
+            if remaining <= 0:
+                process.kill()
+                process.wait()
+                raise subprocess.TimeoutExpired(command, timeout)
+            ready, _, _ = select.select([process.stdout], [], [], min(5.0, remaining))
+            if not ready:
+                continue
+            try:
+                chunk = os.read(stdout_fd, 65536)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                continue  # EOF; poll() picks up the exit
+            output_parts.append(chunk)
+            # Only re-scan when this chunk could complete an object
+            if b'}' in chunk:
+                result = _extract_json_object(
+                    b''.join(output_parts).decode('utf-8', errors='replace'))
+                if result is not None:
+                    process.terminate()
+                    return result, ''
+        os.set_blocking(stdout_fd, True)
+        rest = process.stdout.read()
+        if rest:
+            output_parts.append(rest)
+    finally:
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    text = b''.join(output_parts).decode('utf-8', errors='replace')
+    result = _extract_json_object(text)
+    if result is not None:
+        return result, ''
+    if process.returncode != 0:
+        return None, f"LLM error: {text[-200:].strip()}"
+    return None, "Could not parse LLM response"
+
+
+# Copilot CLI model names → Anthropic API model names, for the direct-API path
+_ANTHROPIC_MODEL_ALIASES = {
+    'claude-sonnet-4.5': 'claude-sonnet-4-5',
+    'claude-haiku-4.5': 'claude-haiku-4-5',
+}
+
+ANTHROPIC_API_URL = 'https://api.anthropic.com/v1/messages'
+
+
+def _llm_json_via_api(prompt: str, model: str, timeout: int = 60,
+                      static_prefix: str | None = None) -> dict | None:
+    """POST a self-contained prompt straight to the Anthropic Messages API.
+
+    The CLI subprocess pays Node + CLI startup on every call; for prompts
+    that need no tool use (the calendar match is pure prompt-in/JSON-out)
+    a direct HTTPS call skips that entirely. Returns the parsed JSON
+    object from the response text, or None so the caller can fall back to
+    the subprocess path.
+
+    static_prefix, when given, is sent as a separate content block marked
+    with a cache_control breakpoint so the provider caches its prefill;
+    repeated calls within the cache TTL then only pay for the dynamic
+    prompt tail.
+    """
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        return None
+
+    if static_prefix:
+        content = [
+            {'type': 'text', 'text': static_prefix,
+             'cache_control': {'type': 'ephemeral'}},
+            {'type': 'text', 'text': prompt},
+        ]
+    else:
+        content = prompt
+
+    body = json.dumps({
+        'model': _ANTHROPIC_MODEL_ALIASES.get(model, model),
+        'max_tokens': 1024,
+        'messages': [{'role': 'user', 'content': content}],
+    }).encode('utf-8')
+    request = urllib.request.Request(
+        ANTHROPIC_API_URL,
+        data=body,
+        headers={
+            'x-api-key': api_key,
+            'anthropic-version': '2023-06-01',
+            'content-type': 'application/json',
+        },
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            payload = json.load(response)
+    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError, OSError) as e:
+        print(f"  Direct API call failed ({e}), falling back to CLI")
+        return None
+
+    text = ''.join(block.get('text', '')
+                   for block in payload.get('content', [])
+                   if block.get('type') == 'text')
+    return _extract_json_object(text)
+
+
 def is_transcript_worth_processing(filepath: str) -> tuple[bool, str]:
     """Check if a transcript has enough content to be worth summarizing.
     
     Returns (True, "") if worth processing, or (False, reason) if it should be skipped.
     Uses simple heuristics — no LLM call needed.
     """
-    body = get_transcript_body(filepath).strip()
-    
+    # Duration check first: it only needs the bounded header peek, so a
+    # large recording of a too-brief meeting is rejected without reading
+    # its body. Files that pass go through read_transcript_cached, which
+    # also warms the cache for the detection/split stages.
+    metadata = parse_transcript_header(filepath)
+    start = metadata.get('_meeting_start_dt')
+    end = metadata.get('_meeting_end_dt')
+    if start and end:
+        duration = (end - start).total_seconds()
+        if duration < MIN_DURATION_SECONDS:
+            return False, f"too brief ({int(duration)}s, need {MIN_DURATION_SECONDS}s)"
+
+    _, body = read_transcript_cached(filepath)
+    body = body.strip()
+
     if len(body) < MIN_BODY_LENGTH:
         return False, f"too short ({len(body)} chars, need {MIN_BODY_LENGTH})"
-    
-    metadata = parse_transcript_header(filepath)
-    if metadata.get('meeting_start') and metadata.get('meeting_end'):
-        try:
-            start = datetime.fromisoformat(metadata['meeting_start'])
-            end = datetime.fromisoformat(metadata['meeting_end'])
-            duration = (end - start).total_seconds()
-            if duration < MIN_DURATION_SECONDS:
-                return False, f"too brief ({int(duration)}s, need {MIN_DURATION_SECONDS}s)"
-        except (ValueError, TypeError):
-            pass  # Can't parse timestamps, skip duration check
-    
+
     return True, ""
 
 
 def detect_multi_meeting(filepath: str, calendar_path: str = None,
                          target: str = 'copilot', model: str = None,
-                         debug: bool = False) -> list[int] | None:
+                         debug: bool = False, use_cache: bool = False) -> list[int] | None:
     """Detect if a transcript contains multiple back-to-back meetings.
-    
+
     Returns a list of character positions where splits should occur,
     or None if the transcript appears to be a single meeting.
     Only called for long transcripts where multi-meeting is plausible.
+
+    With use_cache=True, the parsed LLM detection is served from the
+    on-disk LLM response cache when the transcript body and calendar
+    context are unchanged, skipping the multi-second subprocess round trip
+    on reprocess/resume runs.
     """
-    body = get_transcript_body(filepath).strip()
-    metadata = parse_transcript_header(filepath)
-    
+    metadata, body = read_transcript_cached(filepath)
+    body = body.strip()
+
     # Check if transcript is long enough to plausibly contain multiple meetings
     duration = None
-    if metadata.get('meeting_start') and metadata.get('meeting_end'):
-        try:
-            start = datetime.fromisoformat(metadata['meeting_start'])
-            end = datetime.fromisoformat(metadata['meeting_end'])
-            duration = (end - start).total_seconds()
-        except (ValueError, TypeError):
-            pass
-    
+    meeting_start = metadata.get('_meeting_start_dt')
+    meeting_end = metadata.get('_meeting_end_dt')
+    if meeting_start and meeting_end:
+        duration = (meeting_end - meeting_start).total_seconds()
+
     # Build calendar context if available
     calendar_hint = ""
     overlapping_count = 0
-    if calendar_path and os.path.exists(calendar_path) and duration and metadata.get('meeting_start'):
+    if calendar_path and os.path.exists(calendar_path) and duration:
         try:
-            meeting_start = datetime.fromisoformat(metadata['meeting_start'])
-            meeting_end = datetime.fromisoformat(metadata['meeting_end'])
             meeting_date = meeting_start.strftime('%Y-%m-%d')
-            calendar_entries = parse_calendar_org(calendar_path)
-            day_entries = [e for e in calendar_entries if e['date'] == meeting_date]
+            day_entries = calendar_entries_by_date(calendar_path).get(meeting_date, [])
             overlapping = [e for e in day_entries
                            if time_overlaps(e, meeting_start, meeting_end)]
             overlapping_count = len(overlapping)
@@ -365,7 +708,19 @@ def detect_multi_meeting(filepath: str, calendar_path: str = None,
     
     if not should_check:
         return None
-    
+
+    # Cheap pre-filter: long single meetings vastly outnumber true
+    # back-to-back recordings, and without boundary language the LLM has
+    # nothing to anchor a split on anyway.
+    body_lower = body.lower()
+    farewells = sum(body_lower.count(t) for t in _FAREWELL_TOKENS)
+    greetings = sum(body_lower.count(t) for t in _GREETING_TOKENS)
+    if farewells < 2 or greetings < 2:
+        if debug:
+            print(f"  Multi-meeting: no boundary language "
+                  f"({farewells} farewells, {greetings} greetings), skipping LLM check")
+        return None
+
     print(f"  Multi-meeting check: {len(body)} chars, {int(duration or 0)}s duration, "
           f"{overlapping_count} calendar entries")
     
@@ -403,26 +758,31 @@ Be CONSERVATIVE — only split if you see clear meeting-ending AND meeting-start
 
     model_name = model if model else 'claude-haiku-4.5'
     command = [COPILOT_PATH, '-p', prompt, '--allow-all-tools', '--allow-all-paths', '--model', model_name]
-    
-    try:
-        if debug:
-            print(f"  Multi-meeting: Running LLM detection...")
-        result = subprocess.run(command, capture_output=True, text=True, timeout=120)
-        
-        if result.returncode != 0:
-            print(f"  Multi-meeting: LLM error: {result.stderr[:200]}")
-            return None
-        
-        output = result.stdout.strip()
-        detection = _extract_json_object(output)
-        if not detection:
-            print(f"  Multi-meeting: Could not parse LLM response")
+
+    # Cache key is the content the LLM actually sees (body + calendar
+    # context), not the prompt — the prompt embeds the file path, which
+    # says nothing about the bytes behind it.
+    cache_text = body + '\0' + calendar_hint if use_cache else None
+    detection = llm_cache_get(model_name, cache_text) if use_cache else None
+    if detection is not None and debug:
+        print(f"  Multi-meeting: Using cached detection")
+
+    if detection is None:
+        try:
+            if debug:
+                print(f"  Multi-meeting: Running LLM detection...")
+            detection, error_detail = _run_json_subprocess(command, timeout=120)
+            if not detection:
+                print(f"  Multi-meeting: {error_detail}")
+                return None
+
+        except subprocess.TimeoutExpired:
+            print(f"  Multi-meeting: LLM timed out")
             return None
-        
-    except subprocess.TimeoutExpired:
-        print(f"  Multi-meeting: LLM timed out")
-        return None
-    
+
+        if use_cache:
+            llm_cache_put(model_name, cache_text, detection)
+
     meeting_count = detection.get('meeting_count', 1)
     confidence = detection.get('confidence', 0)
     reasoning = detection.get('reasoning', '')
@@ -434,25 +794,30 @@ Be CONSERVATIVE — only split if you see clear meeting-ending AND meeting-start
     print(f"  Multi-meeting: Detected {meeting_count} meetings (confidence: {confidence:.0%})")
     print(f"  Reasoning: {reasoning}")
     
-    # Find split positions in the body text using the text anchors
+    # Find split positions in the body text using the text anchors.
+    # The LLM emits split points in document order, so each search starts
+    # from the previous split instead of rescanning the body from the top.
     split_positions = []
+    pos = 0
     for sp in detection.get('split_points', []):
         text_before = sp.get('text_before', '')
         text_after = sp.get('text_after', '')
-        
+
         if text_before:
             # Find the position of text_before in the body
-            idx = body.find(text_before)
+            idx = body.find(text_before, pos)
             if idx >= 0:
-                split_positions.append(idx + len(text_before))
+                pos = idx + len(text_before)
+                split_positions.append(pos)
                 continue
-        
+
         if text_after:
-            idx = body.find(text_after)
+            idx = body.find(text_after, pos)
             if idx >= 0:
+                pos = idx
                 split_positions.append(idx)
                 continue
-        
+
         print(f"  Warning: Could not locate split point in transcript")
     
     return split_positions if split_positions else None
@@ -463,21 +828,14 @@ def split_transcript(filepath: str, split_positions: list[int], paths: dict) ->
     
     Returns list of new file paths created in the inbox directory.
     """
-    body = get_transcript_body(filepath)
-    metadata = parse_transcript_header(filepath)
+    metadata, body = read_transcript_cached(filepath)
     basename = os.path.basename(filepath)
     name_stem = os.path.splitext(basename)[0]
     ext = os.path.splitext(basename)[1]
     
-    # Parse timestamps for interpolation
-    start_time = None
-    end_time = None
-    if metadata.get('meeting_start') and metadata.get('meeting_end'):
-        try:
-            start_time = datetime.fromisoformat(metadata['meeting_start'])
-            end_time = datetime.fromisoformat(metadata['meeting_end'])
-        except (ValueError, TypeError):
-            pass
+    # Timestamps were parsed once alongside the front matter
+    start_time = metadata.get('_meeting_start_dt')
+    end_time = metadata.get('_meeting_end_dt')
     
     total_len = len(body)
     
@@ -503,20 +861,29 @@ def split_transcript(filepath: str, split_positions: list[int], paths: dict) ->
                 part_metadata['meeting_start'] = part_start.isoformat()
                 part_metadata['meeting_end'] = part_end.isoformat()
             
-            # Build YAML front matter
-            front_matter_lines = ['---']
-            for key in ('meeting_start', 'meeting_end', 'recording_source'):
-                if key in part_metadata:
-                    front_matter_lines.append(f"{key}: {part_metadata[key]}")
-            front_matter_lines.append('---\n\n')
-            front_matter = '\n'.join(front_matter_lines)
-            
-            # Write to inbox
+            # Build YAML front matter as small pieces; writelines streams
+            # them plus the segment body without materializing a combined
+            # string (the body alone can be tens of KB per part). The
+            # schema is fixed, so emit the three known keys straight-line.
+            parts = ['---\n']
+            if 'meeting_start' in part_metadata:
+                parts.append(f"meeting_start: {part_metadata['meeting_start']}\n")
+            if 'meeting_end' in part_metadata:
+                parts.append(f"meeting_end: {part_metadata['meeting_end']}\n")
+            if 'recording_source' in part_metadata:
+                parts.append(f"recording_source: {part_metadata['recording_source']}\n")
+            parts.append('---\n\n')
+            parts.append(segment_body)
+
+            # Write to inbox atomically: a crash mid-write leaves a .tmp
+            # file the inbox scan ignores, never a truncated transcript
             part_name = f"{name_stem}-part{i+1}{ext}"
             part_path = os.path.join(paths['inbox'], part_name)
-            with open(part_path, 'w', encoding='utf-8') as f:
-                f.write(front_matter + segment_body)
-            
+            tmp_path = part_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(parts)
+            os.replace(tmp_path, part_path)
+
             new_files.append(part_path)
             print(f"  Split: created {part_name} ({len(segment_body)} chars)")
     except (OSError, IOError) as e:
@@ -536,6 +903,22 @@ def split_transcript(filepath: str, split_positions: list[int], paths: dict) ->
     return new_files
 
 
+_OVERLAP_TOLERANCE = timedelta(minutes=5)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_hhmm(value: str) -> tuple[int, int] | None:
+    """Parse an 'HH:MM' string to (hour, minute), or None if malformed."""
+    try:
+        hour_str, minute_str = value.split(':')
+        hour, minute = int(hour_str), int(minute_str)
+    except ValueError:
+        return None
+    if 0 <= hour <= 23 and 0 <= minute <= 59:
+        return hour, minute
+    return None
+
+
 def time_overlaps(calendar_entry: dict, meeting_start: datetime, meeting_end: datetime) -> bool:
     """Check if a calendar entry's time window overlaps with the meeting window.
     
@@ -546,38 +929,59 @@ def time_overlaps(calendar_entry: dict, meeting_start: datetime, meeting_end: da
     """
     if not calendar_entry.get('start_time') or not calendar_entry.get('end_time'):
         return True  # All-day events always match
-    
-    # Parse calendar times as hours/minutes on the meeting date
-    try:
-        cal_start_parts = calendar_entry['start_time'].split(':')
-        cal_end_parts = calendar_entry['end_time'].split(':')
-        
-        cal_start = meeting_start.replace(
-            hour=int(cal_start_parts[0]), minute=int(cal_start_parts[1]),
-            second=0, microsecond=0)
-        cal_end = meeting_start.replace(
-            hour=int(cal_end_parts[0]), minute=int(cal_end_parts[1]),
-            second=0, microsecond=0)
-    except (ValueError, IndexError):
+
+    # Parse calendar times as hours/minutes on the meeting date. The same
+    # handful of HH:MM strings recur across a day's entries, so the split
+    # + int conversions are memoized.
+    start_hm = _parse_hhmm(calendar_entry['start_time'])
+    end_hm = _parse_hhmm(calendar_entry['end_time'])
+    if start_hm is None or end_hm is None:
         return True  # Can't parse times, don't filter
-    
+
+    cal_start = meeting_start.replace(
+        hour=start_hm[0], minute=start_hm[1], second=0, microsecond=0)
+    cal_end = meeting_start.replace(
+        hour=end_hm[0], minute=end_hm[1], second=0, microsecond=0)
+
     # Apply 5-minute tolerance — meetings often run over or start slightly late
-    from datetime import timedelta
-    tolerance = timedelta(minutes=5)
-    cal_start_tolerant = cal_start - tolerance
-    cal_end_tolerant = cal_end + tolerance
-    
+    cal_start_tolerant = cal_start - _OVERLAP_TOLERANCE
+    cal_end_tolerant = cal_end + _OVERLAP_TOLERANCE
+
     # Check overlap: two intervals overlap if start1 < end2 and start2 < end1
     return meeting_start < cal_end_tolerant and cal_start_tolerant < meeting_end
 
 
 def ensure_unique_filename(directory, base_name, extension):
-    """Ensure filename is unique by appending counter if necessary."""
-    filepath = os.path.join(directory, f"{base_name}.{extension}")
-    if not os.path.exists(filepath):
-        return filepath
-    
-    counter = 1
+    """Ensure filename is unique by appending counter if necessary.
+
+    One scandir pass finds the highest existing counter for the prefix,
+    so a crowded slug costs a single directory read rather than one
+    exists() probe per taken name.
+    """
+    plain_name = f"{base_name}.{extension}"
+    prefix = f"{base_name}-"
+    suffix = f".{extension}"
+    exact = False
+    max_counter = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name == plain_name:
+                    exact = True
+                elif name.startswith(prefix) and name.endswith(suffix):
+                    mid = name[len(prefix):-len(suffix)]
+                    if mid.isdigit():
+                        max_counter = max(max_counter, int(mid))
+    except OSError:
+        pass  # Directory missing/unreadable — fall back to probing below
+
+    if not exact:
+        filepath = os.path.join(directory, plain_name)
+        if not os.path.exists(filepath):
+            return filepath
+    # Probe from just past the scanned maximum — normally the first try
+    counter = max_counter + 1
     while True:
         filepath = os.path.join(directory, f"{base_name}-{counter}.{extension}")
         if not os.path.exists(filepath):
@@ -587,16 +991,39 @@ def ensure_unique_filename(directory, base_name, extension):
 
 def gather_recent_notes_context(notes_dir: str, limit: int = 30) -> str:
     """Extract metadata from recent notes to help with participant identification.
-    
+
     Returns a formatted string showing recent meeting patterns:
     - Who attends which types of meetings
     - What topics each person typically discusses
+
+    Memoized on the directory's mtime so a batch of N transcripts walks
+    the notes directory once, not N times; finalizing a new note touches
+    the directory and invalidates the cache.
     """
-    if not os.path.exists(notes_dir):
+    try:
+        st = os.stat(notes_dir)
+    except OSError:
         return ""
-    
-    notes_files = sorted(glob.glob(os.path.join(notes_dir, '*.org')), reverse=True)[:limit]
-    
+    return _notes_context_cached(notes_dir, st.st_mtime_ns, limit)
+
+
+@functools.lru_cache(maxsize=8)
+def _notes_context_cached(notes_dir: str, mtime_ns: int, limit: int) -> str:
+    # Newest-first by name (YYYYMMDD-slug.org sorts chronologically); a
+    # bounded heap keeps the top `limit` without sorting the whole listing
+    # temp-*.org are in-flight (or crash-leftover) summaries living in
+    # notes/ until finalize renames them; besides being half-written,
+    # 'temp-' sorts above every YYYYMMDD- name, so without the filter
+    # they would crowd out the genuinely newest notes
+    with os.scandir(notes_dir) as it:
+        notes_files = [e.path for e in heapq.nlargest(
+            limit,
+            (e for e in it
+             if e.name.endswith('.org') and not e.name.startswith('temp-')
+             and e.is_file()),
+            key=lambda e: e.name)]
+
+
     if not notes_files:
         return ""
     
@@ -607,24 +1034,25 @@ def gather_recent_notes_context(notes_dir: str, limit: int = 30) -> str:
             with open(note_file, 'r', encoding='utf-8') as f:
                 content = f.read(2000)  # Just read header portion
             
-            # Extract participants
-            participants_match = re.search(r':PARTICIPANTS:\s*(.+?)(?:\n|$)', content)
-            if not participants_match:
+            # Extract participants and topic in one scan over the header
+            participants_raw = None
+            topic = None
+            for m in _NOTE_CONTEXT_RE.finditer(content):
+                if m.group('parts') is not None:
+                    if participants_raw is None:
+                        participants_raw = m.group('parts')
+                elif topic is None:
+                    topic = m.group('topic').strip()
+                if participants_raw is not None and topic is not None:
+                    break
+            if participants_raw is None:
                 continue
-            
-            participants = [p.strip() for p in participants_match.group(1).split(',')]
+
+            participants = [p.strip() for p in participants_raw.split(',')]
             # Filter to non-Edd participants in 1:1s
-            other_participants = [p for p in participants 
+            other_participants = [p for p in participants
                                   if 'edd' not in p.lower() and p.strip()]
-            
-            # Extract topic
-            topic_match = re.search(r':TOPIC:\s*(.+?)(?:\n|$)', content)
-            topic = topic_match.group(1).strip() if topic_match else None
-            
-            # Extract title (first line after **)
-            title_match = re.search(r'^\*\*\s+(.+?)(?:\s+:note)?', content, re.MULTILINE)
-            title = title_match.group(1).strip() if title_match else None
-            
+
             # For 1:1s, associate topics with the other person
             if len(other_participants) == 1 and topic:
                 person = other_participants[0]
@@ -667,43 +1095,95 @@ def gather_recent_notes_context(notes_dir: str, limit: int = 30) -> str:
 # for potential reprocessing of existing notes without transcripts.
 # ============================================================================
 
+# Precompiled patterns for org parsing and enrichment. Module-level so hot
+# callers skip the per-call lookup in re's internal pattern cache.
+# Calendar entry heading: * Title <timestamp>
+_CALENDAR_HEADER_RE = re.compile(
+    r'\* (.+?) <(\d{4}-\d{2}-\d{2}) \w{3}(?: (\d{2}:\d{2})-(\d{2}:\d{2}))?>\s*(?:\n|$)'
+)
+_PARTICIPANTS_RE = re.compile(r':PARTICIPANTS:\s*(.+?)(?:\n|$)')
+_EMAIL_ADDR_RE = re.compile(r'\s*<[^>]+>\s*')
+# One alternation pass pulls both fields gather_recent_notes_context needs
+# from a note header instead of a separate scan per field
+_NOTE_CONTEXT_RE = re.compile(
+    r'^:(?:PARTICIPANTS:\s*(?P<parts>.+?)|TOPIC:\s*(?P<topic>.+?))\s*$',
+    re.MULTILINE)
+_MEETING_LINK_RE = re.compile(r'\[\[(https://[^\]]+)\]\[📹[^\]]*\]\]')
+_NOTES_TITLE_RE = re.compile(r'^\*\* (.+?)\s+:note:', re.MULTILINE)
+_NOTES_TIMESTAMP_RE = re.compile(r'\[(\d{4}-\d{2}-\d{2}) (\w{3})(?: (\d{2}:\d{2}))?\]')
+# Single-pass alternations: pull every property (and, for calendar bodies,
+# every meeting link) out of a body in one scan instead of one scan per field
+_NOTES_PROPS_RE = re.compile(r'^:(PARTICIPANTS|SLUG|TOPIC):\s*(.+?)\s*$', re.MULTILINE)
+_CALENDAR_BODY_RE = re.compile(
+    r'^:PARTICIPANTS:\s*(?P<participants>.+?)\s*$'
+    r'|\[\[(?P<link>https://[^\]]+)\]\[📹[^\]]*\]\]',
+    re.MULTILINE
+)
+_END_DRAWER_RE = re.compile(r'(:END:\s*\n)')
+_TIMESTAMP_DAY_RE = re.compile(r'\d{4}-\d{2}-\d{2} (\w{3})')
+
+
+def _iter_calendar_entry_slices(calendar_path: str):
+    """Yield each top-level calendar entry as a decoded str slice.
+
+    Maps the file and walks '\\n* ' heading boundaries with bytes.find
+    instead of reading the whole file into one str and running a
+    MULTILINE|DOTALL regex over it — the file is scanned once in C and
+    only one entry is materialized as a str at a time.
+    """
+    with open(calendar_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return  # Empty file cannot be mapped
+        with mm:
+            size = len(mm)
+            if mm[:2] == b'* ':
+                start = 0
+            else:
+                start = mm.find(b'\n* ')
+                if start < 0:
+                    return
+                start += 1
+            while start < size:
+                nxt = mm.find(b'\n* ', start)
+                end = size if nxt < 0 else nxt + 1
+                yield mm[start:end].decode('utf-8', errors='replace')
+                if nxt < 0:
+                    return
+                start = nxt + 1
+
+
 def parse_calendar_org(calendar_path: str) -> list[dict]:
     """Parse calendar.org and extract meeting entries."""
     entries = []
-    
-    with open(calendar_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Pattern: * Title <timestamp>
-    entry_pattern = re.compile(
-        r'^\* (.+?) <(\d{4}-\d{2}-\d{2}) \w{3}(?: (\d{2}:\d{2})-(\d{2}:\d{2}))?>\s*\n(.*?)(?=^\* |\Z)',
-        re.MULTILINE | re.DOTALL
-    )
-    
-    for match in entry_pattern.finditer(content):
+
+    for entry_text in _iter_calendar_entry_slices(calendar_path):
+        match = _CALENDAR_HEADER_RE.match(entry_text)
+        if not match:
+            continue  # Heading without a recognized timestamp
         title = match.group(1).strip()
         date_str = match.group(2)
         start_time = match.group(3)
         end_time = match.group(4)
-        body = match.group(5).strip()
-        
-        # Extract PARTICIPANTS from properties
+        body = entry_text[match.end():].strip()
+
+        # Extract PARTICIPANTS and video call links in one pass over the body
         participants = []
-        participants_match = re.search(r':PARTICIPANTS:\s*(.+?)(?:\n|$)', body)
-        if participants_match:
-            raw_participants = participants_match.group(1)
-            for p in raw_participants.split(','):
+        meeting_links = []
+        for body_match in _CALENDAR_BODY_RE.finditer(body):
+            link = body_match.group('link')
+            if link:
+                meeting_links.append(link)
+                continue
+            if participants:
+                continue  # First PARTICIPANTS line wins
+            for p in body_match.group('participants').split(','):
                 p = p.strip()
-                name = re.sub(r'\s*<[^>]+>\s*', '', p).strip()
+                name = _EMAIL_ADDR_RE.sub('', p).strip()
                 if name:
                     participants.append(name)
         
-        # Extract video call links from body
-        meeting_links = []
-        link_pattern = re.compile(r'\[\[(https://[^\]]+)\]\[📹[^\]]*\]\]')
-        for link_match in link_pattern.finditer(body):
-            meeting_links.append(link_match.group(1))
-        
         entries.append({
             'title': title,
             'date': date_str,
@@ -716,10 +1196,70 @@ def parse_calendar_org(calendar_path: str) -> list[dict]:
     return entries
 
 
-def parse_notes_org_for_calendar(notes_path: str) -> dict:
-    """Parse a notes.org file for calendar matching."""
-    with open(notes_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+def parse_calendar_org_cached(calendar_path: str) -> list[dict]:
+    """Parse calendar.org, serving repeat runs from an on-disk cache.
+
+    The parsed entries are pickled under LLM_CACHE_DIR (not next to
+    calendar.org — a sidecar would dirty the data repo) and invalidated
+    when the file's mtime or size changes. The cache is best-effort: any
+    failure falls through to a fresh parse.
+    """
+    try:
+        stat = os.stat(calendar_path)
+    except OSError:
+        return parse_calendar_org(calendar_path)
+
+    key = hashlib.sha256(os.path.abspath(calendar_path).encode('utf-8')).hexdigest()[:16]
+    cache_file = os.path.join(LLM_CACHE_DIR, f'calendar-{key}.pkl')
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('mtime_ns') == stat.st_mtime_ns and cached.get('size') == stat.st_size:
+            return cached['entries']
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    entries = parse_calendar_org(calendar_path)
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        tmp_file = cache_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                         'entries': entries}, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+    return entries
+
+
+@functools.lru_cache(maxsize=8)
+def _calendar_by_date_cached(calendar_path: str, mtime_ns: int) -> dict[str, list[dict]]:
+    by_date = {}
+    for entry in parse_calendar_org_cached(calendar_path):
+        by_date.setdefault(entry['date'], []).append(entry)
+    return by_date
+
+
+def calendar_entries_by_date(calendar_path: str) -> dict[str, list[dict]]:
+    """Parse calendar.org and index entries by date.
+
+    Day lookups become a single dict access instead of a scan over every
+    entry — which matters when many transcripts are matched against the
+    same calendar in one run. The index is memoized in-process on
+    (path, mtime), so per-transcript callers don't re-read even the
+    pickled parse cache; callers treat the result as read-only.
+    """
+    try:
+        mtime_ns = os.stat(calendar_path).st_mtime_ns
+    except OSError:
+        return {}
+    return _calendar_by_date_cached(calendar_path, mtime_ns)
+
+
+def parse_notes_org_for_calendar(notes_path: str) -> dict:
+    """Parse a notes.org file for calendar matching."""
+    with open(notes_path, 'r', encoding='utf-8') as f:
+        content = f.read()
     
     result = {
         'title': None, 'timestamp': None, 'date': None, 'time': None,
@@ -727,59 +1267,34 @@ def parse_notes_org_for_calendar(notes_path: str) -> dict:
     }
     
     # Extract title (first ** heading)
-    title_match = re.search(r'^\*\* (.+?)\s+:note:', content, re.MULTILINE)
+    title_match = _NOTES_TITLE_RE.search(content)
     if title_match:
         result['title'] = title_match.group(1).strip()
-    
+
     # Extract timestamp [YYYY-MM-DD Day HH:MM]
-    ts_match = re.search(r'\[(\d{4}-\d{2}-\d{2}) (\w{3})(?: (\d{2}:\d{2}))?\]', content)
+    ts_match = _NOTES_TIMESTAMP_RE.search(content)
     if ts_match:
         result['date'] = ts_match.group(1)
         result['time'] = ts_match.group(3)
         result['timestamp'] = ts_match.group(0)
-    
-    # Extract properties
-    for prop in ['PARTICIPANTS', 'SLUG', 'TOPIC']:
-        match = re.search(rf':{prop}:\s*(.+?)(?:\n|$)', content)
-        if match:
-            if prop == 'PARTICIPANTS':
-                result['participants'] = [p.strip() for p in match.group(1).split(',')]
-            else:
-                result[prop.lower()] = match.group(1).strip()
-    
-    return result
 
+    # Extract properties in one pass; first occurrence of each wins
+    for match in _NOTES_PROPS_RE.finditer(content):
+        prop, value = match.group(1), match.group(2)
+        if prop == 'PARTICIPANTS':
+            if not result['participants']:
+                result['participants'] = [p.strip() for p in value.split(',')]
+        elif result[prop.lower()] is None:
+            result[prop.lower()] = value.strip()
 
-def build_calendar_prompt(notes: dict, calendar_entries: list[dict]) -> str:
-    """Build prompt for LLM calendar matching."""
-    # Format calendar entries
-    lines = []
-    for i, e in enumerate(calendar_entries, 1):
-        time_str = f"{e['start_time']}-{e['end_time']}" if e['start_time'] else "all-day"
-        participants = ', '.join(e['participants']) if e['participants'] else 'unknown'
-        lines.append(f"{i}. [{time_str}] {e['title']}")
-        lines.append(f"   Participants: {participants}")
-        if e['meeting_links']:
-            lines.append(f"   Meeting link: {e['meeting_links'][0]}")
-        lines.append("")
-    calendar_text = '\n'.join(lines) if lines else "No calendar entries for this date."
-    
-    participants_str = ', '.join(notes['participants']) if notes['participants'] else 'unknown'
-    participant_count = len(notes['participants']) if notes['participants'] else 0
-    
-    return f"""You are helping match a meeting transcript to a calendar entry.
+    return result
 
-## Calendar entries for {notes['date']}:
 
-{calendar_text}
-
-## Meeting notes metadata:
-- Title: {notes['title']}
-- Time in notes: {notes['time'] or 'unknown'}
-- PARTICIPANTS DETECTED: {participants_str}
-- Participant count: {participant_count}
-- Topic: {notes['topic'] or 'unknown'}
-- Current slug: {notes['slug']}
+# Static instruction block for calendar matching. Kept as a module constant
+# and placed at the start of the prompt so backend prefix caches (Claude
+# prompt caching, KV-cache reuse) can hit on the shared prefix across calls —
+# only the calendar/notes variables at the tail change per file.
+CALENDAR_MATCH_INSTRUCTIONS = """You are helping match a meeting transcript to a calendar entry.
 
 ## CRITICAL: Participant-First Matching Strategy
 
@@ -804,7 +1319,7 @@ Look at each calendar entry's participants and check if the detected participant
 - In this case, use the calendar entry to CORRECT the participant identification
 - Lower confidence (70-80%) since we're correcting a potential error
 
-**IF {participant_count} participants detected (one being Edd) = 2:**
+**IF exactly 2 participants are detected (one being Edd):**
 - This is almost certainly a 1:1 meeting
 - STRONGLY PREFER matching to a 1:1 calendar entry (format: "name / ewilderj 1:1")
 - Do NOT match to team syncs, SLT meetings, or group meetings just because topics overlap
@@ -820,7 +1335,7 @@ Look at each calendar entry's participants and check if the detected participant
 - DON'T let meeting title keywords override participant matching
 
 ## Response format (output ONLY this JSON, no other text):
-{{
+{
   "matched": true/false,
   "confidence": 0.0-1.0,
   "calendar_entry_number": N or null,
@@ -830,7 +1345,7 @@ Look at each calendar entry's participants and check if the detected participant
   "suggested_title": "Improved title incorporating calendar info" or null,
   "suggested_slug": "improved-slug-with-participant-names" or null,
   "reasoning": "Brief explanation: which participants matched which calendar entry"
-}}
+}
 
 ## Slug guidelines:
 - For 1:1 meetings: "firstname-edd-1-1" (e.g., "mia-edd-1-1", "thabani-edd-1-1")
@@ -841,23 +1356,71 @@ Look at each calendar entry's participants and check if the detected participant
 - For 1:1s: "Name / Edd 1:1: Topic Summary" - ALWAYS preserve the original topic
 - For groups: keep the descriptive title from the notes
 
-Output ONLY the JSON object, nothing else."""
+Output ONLY the JSON object, nothing else.
+"""
+
+
+def build_calendar_prompt(notes: dict, calendar_entries: list[dict]) -> str:
+    """Build prompt for LLM calendar matching.
+
+    Static instructions first, per-file variables last — the instruction
+    prefix is identical across calls, so it stays cacheable.
+    """
+    # Format calendar entries
+    lines = []
+    for i, e in enumerate(calendar_entries, 1):
+        time_str = f"{e['start_time']}-{e['end_time']}" if e['start_time'] else "all-day"
+        participants = ', '.join(e['participants']) if e['participants'] else 'unknown'
+        lines.append(f"{i}. [{time_str}] {e['title']}")
+        lines.append(f"   Participants: {participants}")
+        if e['meeting_links']:
+            lines.append(f"   Meeting link: {e['meeting_links'][0]}")
+        lines.append("")
+    calendar_text = '\n'.join(lines) if lines else "No calendar entries for this date."
+
+    participants_str = ', '.join(notes['participants']) if notes['participants'] else 'unknown'
+    participant_count = len(notes['participants']) if notes['participants'] else 0
+
+    return CALENDAR_MATCH_INSTRUCTIONS + f"""
+## Calendar entries for {notes['date']}:
+
+{calendar_text}
+
+## Meeting notes metadata:
+- Title: {notes['title']}
+- Time in notes: {notes['time'] or 'unknown'}
+- PARTICIPANTS DETECTED: {participants_str}
+- Participant count: {participant_count}
+- Topic: {notes['topic'] or 'unknown'}
+- Current slug: {notes['slug']}
+
+Apply the matching strategy above to these calendar entries and notes, and output ONLY the JSON object."""
+
+
+def enrich_with_calendar(org_path: str, transcript_path: str, calendar_path: str,
+                          target: str = 'copilot', model: str = None, debug: bool = False,
+                          use_cache: bool = False, use_api: bool | None = None) -> tuple[str, str] | None:
+    """Enrich notes with calendar metadata. Returns (old_path, new_path) if renamed, else None.
+
+    With use_cache=True, identical (model, prompt) pairs are served from the
+    on-disk LLM response cache instead of re-running the subprocess.
+    use_api=None (the default) sends the prompt directly to the provider API
+    whenever ANTHROPIC_API_KEY is set, skipping CLI subprocess startup, and
+    falls back to the CLI on any API failure; pass False to force the CLI.
+    """
+    if use_api is None:
+        use_api = bool(os.environ.get('ANTHROPIC_API_KEY'))
 
 
-def enrich_with_calendar(org_path: str, transcript_path: str, calendar_path: str, 
-                          target: str = 'copilot', model: str = None, debug: bool = False) -> tuple[str, str] | None:
-    """Enrich notes with calendar metadata. Returns (old_path, new_path) if renamed, else None."""
-    
     # Parse calendar and notes
-    calendar_entries = parse_calendar_org(calendar_path)
     notes = parse_notes_org_for_calendar(org_path)
-    
+
     if not notes['date']:
         print("  Calendar: Could not extract date from notes")
         return None
-    
+
     # Filter calendar to matching date
-    day_entries = [e for e in calendar_entries if e['date'] == notes['date']]
+    day_entries = calendar_entries_by_date(calendar_path).get(notes['date'], [])
     
     if not day_entries:
         print(f"  Calendar: No entries for {notes['date']}, skipping enrichment")
@@ -870,26 +1433,30 @@ def enrich_with_calendar(org_path: str, transcript_path: str, calendar_path: str
     
     model_name = model if model else 'claude-sonnet-4.5'
     command = [COPILOT_PATH, '-p', prompt, '--allow-all-tools', '--allow-all-paths', '--model', model_name]
-    
-    try:
-        if debug:
-            print(f"  Calendar: Running Copilot for matching...")
-        result = subprocess.run(command, capture_output=True, text=True, timeout=60)
-        
-        if result.returncode != 0:
-            print(f"  Calendar: LLM error: {result.stderr[:200]}")
-            return None
-        
-        # Extract JSON from output
-        output = result.stdout.strip()
-        match_result = _extract_json_object(output)
-        if not match_result:
-            print("  Calendar: Could not parse LLM response")
+
+    match_result = llm_cache_get(model_name, prompt) if use_cache else None
+    if match_result is not None:
+        print("  Calendar: Using cached LLM match result")
+    elif use_api and (match_result := _llm_json_via_api(
+            prompt[len(CALENDAR_MATCH_INSTRUCTIONS):], model_name,
+            static_prefix=CALENDAR_MATCH_INSTRUCTIONS)) is not None:
+        print("  Calendar: Matched via direct API call")
+        if use_cache:
+            llm_cache_put(model_name, prompt, match_result)
+    else:
+        try:
+            if debug:
+                print(f"  Calendar: Running Copilot for matching...")
+            match_result, error_detail = _run_json_subprocess(command, timeout=60)
+            if not match_result:
+                print(f"  Calendar: {error_detail}")
+                return None
+
+            if use_cache:
+                llm_cache_put(model_name, prompt, match_result)
+        except subprocess.TimeoutExpired:
+            print("  Calendar: LLM timed out")
             return None
-        
-    except subprocess.TimeoutExpired:
-        print("  Calendar: LLM timed out")
-        return None
     
     # Check if we have a confident match
     if not match_result.get('matched') or match_result.get('confidence', 0) < 0.7:
@@ -898,42 +1465,75 @@ def enrich_with_calendar(org_path: str, transcript_path: str, calendar_path: str
     
     print(f"  Calendar: Matched to '{match_result.get('calendar_title')}' ({match_result.get('confidence', 0):.0%})")
     
-    # Apply enrichment
+    # Apply enrichment. Each edit is located against the original content
+    # and recorded as a (start, end, replacement) span; the spans are then
+    # spliced in a single join pass, instead of copying the whole file
+    # once per edit.
     content = notes['content']
     old_slug = notes['slug']
     new_slug = match_result.get('suggested_slug', old_slug)
     changes = []
-    
-    # Update title
+    edits = []
+
+    # Update title — the heading is anchored on the known old title, so
+    # locate it with a literal find rather than escaping the title and
+    # going through the regex engine
     if match_result.get('suggested_title') and match_result['suggested_title'] != notes['title']:
-        old_title_escaped = re.escape(notes['title'])
-        content = re.sub(rf'(\*\* ){old_title_escaped}(\s+:note:)', 
-                        f'\\1{match_result["suggested_title"]}\\2', content)
-        changes.append(f"Title updated")
-    
-    # Update slug
+        old_heading = f"** {notes['title']}"
+        i = content.find(old_heading)
+        if i >= 0:
+            rest = content[i + len(old_heading):]
+            if rest[:1] in (' ', '\t') and rest.lstrip(' \t').startswith(':note:'):
+                edits.append((i, i + len(old_heading), f"** {match_result['suggested_title']}"))
+                changes.append(f"Title updated")
+
+    # Update slug — the line is anchored on a fixed sentinel, so a literal
+    # find beats dispatching through the regex engine
     if new_slug and new_slug != old_slug:
-        content = re.sub(r':SLUG:\s*.+?(?=\n)', f':SLUG: {new_slug}', content)
+        i = content.find(':SLUG:')
+        if i >= 0:
+            j = content.find('\n', i)
+            if j < 0:
+                j = len(content)
+            edits.append((i, j, f':SLUG: {new_slug}'))
         changes.append(f"Slug: {old_slug} → {new_slug}")
-    
-    # Add calendar properties (before :END:)
-    for prop, key in [('CALENDAR_MATCH', 'calendar_title'), 
+
+    # Add calendar properties as a zero-width insertion before :END:
+    new_props = []
+    for prop, key in [('CALENDAR_MATCH', 'calendar_title'),
                       ('CALENDAR_TIME', 'calendar_time'),
                       ('MEETING_LINK', 'meeting_link')]:
         if match_result.get(key) and f':{prop}:' not in content:
-            content = re.sub(r'(:END:\s*\n)', f':{prop}: {match_result[key]}\n\\1', content)
+            new_props.append(f':{prop}: {match_result[key]}\n')
             changes.append(f"Added {prop}")
-    
+    if new_props:
+        end_match = _END_DRAWER_RE.search(content)
+        if end_match:
+            edits.append((end_match.start(1), end_match.start(1), ''.join(new_props)))
+
     # Update timestamp
     if match_result.get('calendar_time') and notes['timestamp']:
-        day_match = re.search(r'\d{4}-\d{2}-\d{2} (\w{3})', notes['timestamp'])
+        day_match = _TIMESTAMP_DAY_RE.search(notes['timestamp'])
         if day_match:
             start_time = match_result['calendar_time'].split('-')[0]
             new_ts = f"[{notes['date']} {day_match.group(1)} {start_time}]"
             if notes['timestamp'] != new_ts:
-                content = content.replace(notes['timestamp'], new_ts)
-                changes.append("Timestamp updated")
-    
+                i = content.find(notes['timestamp'])
+                if i >= 0:
+                    edits.append((i, i + len(notes['timestamp']), new_ts))
+                    changes.append("Timestamp updated")
+
+    if edits:
+        edits.sort(key=lambda e: e[0])
+        parts = []
+        cursor = 0
+        for start, end, replacement in edits:
+            parts.append(content[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(content[cursor:])
+        content = ''.join(parts)
+
     if changes:
         print(f"  Calendar: {', '.join(changes)}")
         with open(org_path, 'w', encoding='utf-8') as f:
@@ -964,47 +1564,49 @@ def enrich_with_calendar(org_path: str, transcript_path: str, calendar_path: str
 # Main Processing Functions
 # ============================================================================
 
-def process_transcript(input_file, paths, target='copilot', model=None, prompt_template=None, debug=False, calendar_path=None):
-    """Process a single transcript: summarize with calendar context, extract slug, and organize files."""
-    print(f"\nProcessing: {input_file}")
-    
-    workspace_dir = paths['workspace']
-    
+# Distinguishes temp org files written by concurrent workers; count() is
+# atomic under the GIL so no lock is needed
+_temp_org_counter = itertools.count()
+
+
+def build_transcript_prompt(input_file, paths, prompt_template, calendar_path=None):
+    """Assemble the full summarization prompt for a single transcript.
+
+    Includes calendar context when available. Returns a tuple of
+    (final_prompt, date_str, temp_org_filename).
+    """
     # Parse transcript header for timing metadata
     metadata = parse_transcript_header(input_file)
-    
+
     # Get date from header timestamps, falling back to filename/mtime
-    meeting_start = None
-    meeting_end = None
-    if metadata.get('meeting_start'):
-        try:
-            meeting_start = datetime.fromisoformat(metadata['meeting_start'])
-            date_str = meeting_start.strftime('%Y%m%d')
-            if metadata.get('meeting_end'):
-                meeting_end = datetime.fromisoformat(metadata['meeting_end'])
-            print(f"  Metadata: {metadata.get('recording_source', 'unknown')} recording, "
-                  f"{meeting_start.strftime('%H:%M')}"
-                  f"{'-' + meeting_end.strftime('%H:%M') if meeting_end else ''}")
-        except (ValueError, TypeError):
-            date_str = get_date_from_file(input_file)
+    meeting_start = metadata.get('_meeting_start_dt')
+    meeting_end = metadata.get('_meeting_end_dt')
+    if meeting_start:
+        date_str = meeting_start.strftime('%Y%m%d')
+        meeting_date = meeting_start.date().isoformat()
+        print(f"  Metadata: {metadata.get('recording_source', 'unknown')} recording, "
+              f"{meeting_start.strftime('%H:%M')}"
+              f"{'-' + meeting_end.strftime('%H:%M') if meeting_end else ''}")
     else:
         date_str = get_date_from_file(input_file)
-    
-    meeting_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"  # YYYY-MM-DD format
-    temp_id = uuid.uuid4().hex[:8]
-    temp_org_filename = f"temp-{date_str}-{temp_id}.org"
-    
+        meeting_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"  # YYYY-MM-DD format
+    # pid + counter is unique within this process's workspace — no need
+    # to pull urandom entropy per transcript. The temp file goes straight
+    # into notes/ so the finalize move is a same-directory rename, never a
+    # cross-device copy.
+    temp_id = f"{os.getpid():x}-{next(_temp_org_counter):04x}"
+    temp_org_filename = os.path.join('notes', f"temp-{date_str}-{temp_id}.org")
+
     # Get basename for input file (relative to workspace)
     input_basename = os.path.basename(input_file)
     input_relative = os.path.join('inbox', input_basename)
-    
+
     # Build the prompt - include calendar context if available
     final_prompt = prompt_template.format(input_file=input_relative, output_file=temp_org_filename)
-    
+
     if calendar_path and os.path.exists(calendar_path):
         # Parse calendar and filter to matching date
-        calendar_entries = parse_calendar_org(calendar_path)
-        day_entries = [e for e in calendar_entries if e['date'] == meeting_date]
+        day_entries = calendar_entries_by_date(calendar_path).get(meeting_date, [])
         
         # If we have precise timestamps, filter by time overlap for deterministic matching
         if day_entries and meeting_start and meeting_end:
@@ -1019,27 +1621,189 @@ def process_transcript(input_file, paths, target='copilot', model=None, prompt_t
         if day_entries:
             print(f"  Calendar: Found {len(day_entries)} entries for {meeting_date}")
             calendar_text = format_calendar_for_prompt(day_entries, meeting_date)
-            # Gather recent notes context to help with disambiguation
-            notes_context = gather_recent_notes_context(paths['notes'])
+            # Recent-notes context only helps disambiguate between several
+            # candidate entries — a single match skips the notes walk
+            if len(day_entries) > 1:
+                notes_context = gather_recent_notes_context(paths['notes'])
+            else:
+                notes_context = ""
             
             # Add time context from transcript metadata if available
             if meeting_start:
-                time_hint = f"\n## MEETING TIME FROM TRANSCRIPT\n"
-                time_hint += f"The recording started at {meeting_start.strftime('%H:%M')}"
+                start_hhmm = meeting_start.strftime('%H:%M')
+                end_hhmm = meeting_end.strftime('%H:%M') if meeting_end else '??:??'
+                parts = ["\n## MEETING TIME FROM TRANSCRIPT\n",
+                         f"The recording started at {start_hhmm}"]
                 if meeting_end:
-                    time_hint += f" and ended at {meeting_end.strftime('%H:%M')}"
                     duration_mins = int((meeting_end - meeting_start).total_seconds() / 60)
-                    time_hint += f" (duration: {duration_mins} minutes)"
-                time_hint += ".\n"
-                time_hint += "This STRONGLY constrains which calendar entry matches:\n"
-                time_hint += "- Prefer entries whose time slot contains or overlaps this window\n"
-                time_hint += f"- A {meeting_start.strftime('%H:%M')}-{meeting_end.strftime('%H:%M') if meeting_end else '??:??'} recording almost certainly matches a calendar slot at that time\n"
-                calendar_text = time_hint + "\n" + calendar_text
+                    parts.append(f" and ended at {end_hhmm} (duration: {duration_mins} minutes)")
+                parts.append(
+                    ".\n"
+                    "This STRONGLY constrains which calendar entry matches:\n"
+                    "- Prefer entries whose time slot contains or overlaps this window\n"
+                    f"- A {start_hhmm}-{end_hhmm} recording almost certainly matches a calendar slot at that time\n"
+                    "\n")
+                parts.append(calendar_text)
+                calendar_text = ''.join(parts)
             
             final_prompt = build_calendar_aware_prompt(final_prompt, calendar_text, meeting_date, notes_context)
         else:
             print(f"  Calendar: No entries for {meeting_date}")
-    
+
+    return final_prompt, date_str, temp_org_filename
+
+
+# Serializes the pick-unique-name + move sequence when transcripts are
+# processed concurrently — two same-slug files must not race for one name
+_finalize_lock = threading.Lock()
+
+
+def finalize_summary(input_file, temp_org_path, date_str, paths):
+    """Move a generated summary and its transcript to their final locations.
+
+    Returns (True, transcript_path, org_path).
+    """
+    # Extract slug from the generated org file
+    print("  Extracting slug from summary...")
+    slug = extract_slug_from_org(temp_org_path)
+    base_name = f"{date_str}-{slug}"
+    print(f"  Using filename base: {base_name}")
+
+    with _finalize_lock:
+        # Create final output paths (ensure uniqueness)
+        transcript_path = ensure_unique_filename(paths['transcripts'], base_name, 'txt')
+        org_path = ensure_unique_filename(paths['notes'], base_name, 'org')
+
+        # Move files to their final locations.
+        # Move transcript first — it's the source of truth. If the notes move
+        # fails, we lose only the regenerable summary, not the original data.
+        shutil.move(input_file, transcript_path)
+        print(f"  Moved transcript to: {transcript_path}")
+
+        shutil.move(temp_org_path, org_path)
+        print(f"  Created: {org_path}")
+
+    return True, transcript_path, org_path
+
+
+def _stream_subprocess_output(process, deadline, start_time, debug, input_basename):
+    """Drain a CLI subprocess's stdout with non-blocking chunk reads.
+
+    select signals "bytes available", not "a full line", so readline on a
+    text pipe could block past the poll window. Reading raw chunks with
+    os.read wakes the interpreter once per burst of output instead of once
+    per line, and decodes complete lines as they are cut.
+
+    Returns (output_tail, line_count, timed_out). Only the last 10 lines
+    are retained (enough for failure diagnosis) so a chatty multi-thousand
+    line run doesn't hold its whole output in memory; lines keep their
+    trailing newline. On timeout the process has already been killed and
+    reaped.
+    """
+    stdout_fd = process.stdout.fileno()
+    os.set_blocking(stdout_fd, False)
+    output_tail = deque(maxlen=10)
+    line_count = 0
+    pending = b''
+    last_progress = start_time
+    timed_out = False
+
+    def _emit(raw: bytes, newline: bool = True) -> None:
+        nonlocal line_count
+        line = raw.decode('utf-8', errors='replace') + ('\n' if newline else '')
+        output_tail.append(line)
+        line_count += 1
+        if debug:
+            print(f"  {line}", end='' if newline else '\n', flush=True)
+
+    while process.poll() is None:
+        now = _time.monotonic()
+        if now > deadline:
+            process.kill()
+            process.wait()
+            timed_out = True
+            break
+        remaining = min(5.0, deadline - now)
+        ready, _, _ = select.select([process.stdout], [], [], remaining)
+        if ready:
+            try:
+                chunk = os.read(stdout_fd, 65536)
+            except BlockingIOError:
+                chunk = b''
+            if chunk:
+                pending += chunk
+                if b'\n' in pending:
+                    *complete, pending = pending.split(b'\n')
+                    for raw in complete:
+                        _emit(raw)
+                    now = _time.monotonic()
+        if not debug and now - last_progress >= 30:
+            elapsed = int(now - start_time)
+            print(f"  ... still running ({elapsed}s, {line_count} lines) [{input_basename}]", flush=True)
+            last_progress = now
+
+    if not timed_out:
+        # Read remaining output after process exits
+        os.set_blocking(stdout_fd, True)
+        data = pending + (process.stdout.read() or b'')
+        if data:
+            lines = data.split(b'\n')
+            tail_fragment = lines.pop()
+            for raw in lines:
+                _emit(raw)
+            if tail_fragment:
+                _emit(tail_fragment, newline=False)
+
+    return output_tail, line_count, timed_out
+
+
+def _run_llm_subprocess(command, workspace_dir, stdin_data, timeout, debug, input_basename):
+    """Spawn an LLM CLI subprocess and stream its output until exit or timeout.
+
+    `stdin_data` is the prompt for CLIs that read it from stdin (gemini);
+    None for CLIs that take the prompt as an argument (copilot).
+
+    Returns (returncode, output_tail, line_count, timed_out). On timeout
+    the process has already been killed and reaped.
+    """
+    start_time = _time.monotonic()
+    deadline = start_time + timeout
+    process = subprocess.Popen(
+        command,
+        cwd=workspace_dir,
+        stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0
+    )
+    if stdin_data is not None:
+        # Feed stdin from a daemon thread: a prompt larger than the pipe
+        # buffer would otherwise block here before the read loop starts,
+        # deadlocking against a child that is already producing output.
+        def _feed_stdin() -> None:
+            try:
+                process.stdin.write(stdin_data.encode('utf-8'))
+                process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass  # child exited early; its returncode tells the story
+        threading.Thread(target=_feed_stdin, daemon=True).start()
+    output_tail, line_count, timed_out = _stream_subprocess_output(
+        process, deadline, start_time, debug, input_basename)
+    if not timed_out:
+        process.wait()
+    return process.returncode, output_tail, line_count, timed_out
+
+
+def process_transcript(input_file, paths, target='copilot', model=None, prompt_template=None, debug=False, calendar_path=None):
+    """Process a single transcript: summarize with calendar context, extract slug, and organize files."""
+    print(f"\nProcessing: {input_file}")
+
+    workspace_dir = paths['workspace']
+    input_basename = os.path.basename(input_file)
+
+    final_prompt, date_str, temp_org_filename = build_transcript_prompt(
+        input_file, paths, prompt_template, calendar_path)
+
     # Run summarization
     print(f"  Generating summary...")
 
@@ -1052,82 +1816,7 @@ def process_transcript(input_file, paths, target='copilot', model=None, prompt_t
             '--allow-all-paths',
             '--model', model_name
         ]
-        try:
-            if debug:
-                cmd_display = [c if c != final_prompt else '<prompt>' for c in command]
-                print(f"  Running: {' '.join(cmd_display)}")
-                print(f"  Working directory: {os.path.abspath(workspace_dir)}")
-                print(f"  Prompt length: {len(final_prompt)} chars")
-            else:
-                print(f"  Prompt length: {len(final_prompt)} chars")
-
-            per_file_timeout = 600  # 10 minutes per file
-            start_time = _time.monotonic()
-            deadline = start_time + per_file_timeout
-            process = subprocess.Popen(
-                command,
-                cwd=workspace_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
-            )
-            output_lines = []
-            last_progress = start_time
-            timed_out = False
-
-            while process.poll() is None:
-                now = _time.monotonic()
-                if now > deadline:
-                    process.kill()
-                    process.wait()
-                    timed_out = True
-                    break
-                remaining = min(5.0, deadline - now)
-                ready, _, _ = select.select([process.stdout], [], [], remaining)
-                if ready:
-                    line = process.stdout.readline()
-                    if line:
-                        output_lines.append(line)
-                        now = _time.monotonic()
-                        if debug:
-                            print(f"  {line}", end='', flush=True)
-                        elif now - last_progress >= 30:
-                            elapsed = int(now - start_time)
-                            print(f"  ... still running ({elapsed}s, {len(output_lines)} lines) [{input_basename}]", flush=True)
-                            last_progress = now
-                elif now - last_progress >= 30:
-                    elapsed = int(now - start_time)
-                    print(f"  ... still running ({elapsed}s, {len(output_lines)} lines) [{input_basename}]", flush=True)
-                    last_progress = now
-
-            if timed_out:
-                elapsed = int(_time.monotonic() - start_time)
-                print(f"  Error: Copilot timed out after {elapsed}s [{input_basename}]")
-                # Clean up temp file if it exists
-                temp_org_path = os.path.join(workspace_dir, temp_org_filename)
-                if os.path.exists(temp_org_path):
-                    os.remove(temp_org_path)
-                return False, None, None
-
-            # Read remaining output after process exits
-            for line in process.stdout:
-                output_lines.append(line)
-                if debug:
-                    print(f"  {line}", end='', flush=True)
-
-            process.wait()
-            elapsed = int(_time.monotonic() - start_time)
-            print(f"  Copilot finished in {elapsed}s (exit code {process.returncode}, {len(output_lines)} lines) [{input_basename}]")
-            if process.returncode != 0:
-                # Show last few lines of output for diagnosis
-                tail = ''.join(output_lines[-10:])
-                print(f"  Error in summarization (last output):\n{tail}")
-                return False, None, None
-        except Exception as e:
-            print(f"  Error running copilot: {e}")
-            return False, None, None
-
+        stdin_data = None  # copilot takes the prompt as an argument
     elif target == 'gemini':
         model_name = model if model else 'gemini-3-flash-preview'
         command = [
@@ -1135,114 +1824,140 @@ def process_transcript(input_file, paths, target='copilot', model=None, prompt_t
             '--approval-mode', 'auto_edit',
             '--model', model_name
         ]
-        try:
-            if debug:
-                print(f"  Running: {' '.join(command)}")
-                print(f"  Working directory: {os.path.abspath(workspace_dir)}")
-                print(f"  Prompt length: {len(final_prompt)} chars")
-            else:
-                print(f"  Prompt length: {len(final_prompt)} chars")
-
-            per_file_timeout = 600  # 10 minutes per file
-            start_time = _time.monotonic()
-            deadline = start_time + per_file_timeout
-            process = subprocess.Popen(
-                command,
-                cwd=workspace_dir,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
-            )
-            process.stdin.write(final_prompt)
-            process.stdin.close()
-            output_lines = []
-            last_progress = start_time
-            timed_out = False
-
-            while process.poll() is None:
-                now = _time.monotonic()
-                if now > deadline:
-                    process.kill()
-                    process.wait()
-                    timed_out = True
-                    break
-                remaining = min(5.0, deadline - now)
-                ready, _, _ = select.select([process.stdout], [], [], remaining)
-                if ready:
-                    line = process.stdout.readline()
-                    if line:
-                        output_lines.append(line)
-                        now = _time.monotonic()
-                        if debug:
-                            print(f"  {line}", end='', flush=True)
-                        elif now - last_progress >= 30:
-                            elapsed = int(now - start_time)
-                            print(f"  ... still running ({elapsed}s, {len(output_lines)} lines) [{input_basename}]", flush=True)
-                            last_progress = now
-                elif now - last_progress >= 30:
-                    elapsed = int(now - start_time)
-                    print(f"  ... still running ({elapsed}s, {len(output_lines)} lines) [{input_basename}]", flush=True)
-                    last_progress = now
-
-            if timed_out:
-                elapsed = int(_time.monotonic() - start_time)
-                print(f"  Error: Gemini timed out after {elapsed}s [{input_basename}]")
-                temp_org_path = os.path.join(workspace_dir, temp_org_filename)
-                if os.path.exists(temp_org_path):
-                    os.remove(temp_org_path)
-                return False, None, None
-
-            # Read remaining output after process exits
-            for line in process.stdout:
-                output_lines.append(line)
-                if debug:
-                    print(f"  {line}", end='', flush=True)
+        stdin_data = final_prompt  # gemini reads the prompt from stdin
+    else:
+        print(f"  Error: Unknown target '{target}'")
+        return False, None, None
 
-            process.wait()
-            elapsed = int(_time.monotonic() - start_time)
-            print(f"  Gemini finished in {elapsed}s (exit code {process.returncode}, {len(output_lines)} lines) [{input_basename}]")
-            if process.returncode != 0:
-                tail = ''.join(output_lines[-10:])
-                print(f"  Error in summarization (last output):\n{tail}")
-                return False, None, None
-        except Exception as e:
-            print(f"  Error running gemini: {e}")
+    display_name = target.capitalize()
+    try:
+        if debug:
+            cmd_display = [c if c != final_prompt else '<prompt>' for c in command]
+            print(f"  Running: {' '.join(cmd_display)}")
+            print(f"  Working directory: {os.path.abspath(workspace_dir)}")
+        print(f"  Prompt length: {len(final_prompt)} chars")
+
+        per_file_timeout = 600  # 10 minutes per file
+        start_time = _time.monotonic()
+        returncode, output_tail, line_count, timed_out = _run_llm_subprocess(
+            command, workspace_dir, stdin_data, per_file_timeout, debug, input_basename)
+        elapsed = int(_time.monotonic() - start_time)
+
+        if timed_out:
+            print(f"  Error: {display_name} timed out after {elapsed}s [{input_basename}]")
+            # Clean up temp file if it exists
+            temp_org_path = os.path.join(workspace_dir, temp_org_filename)
+            if os.path.exists(temp_org_path):
+                os.remove(temp_org_path)
             return False, None, None
-    
+
+        print(f"  {display_name} finished in {elapsed}s (exit code {returncode}, {line_count} lines) [{input_basename}]")
+        if returncode != 0:
+            # Show last few lines of output for diagnosis
+            tail = ''.join(output_tail)
+            print(f"  Error in summarization (last output):\n{tail}")
+            return False, None, None
+    except Exception as e:
+        print(f"  Error running {target}: {e}")
+        return False, None, None
+
+
     # Check if org file was created (in workspace)
     temp_org_path = os.path.join(workspace_dir, temp_org_filename)
     if not os.path.exists(temp_org_path):
         print(f"  Error: Expected org file {temp_org_path} was not created")
         return False, None, None
-    
-    # Extract slug from the generated org file
-    print("  Extracting slug from summary...")
-    slug = extract_slug_from_org(temp_org_path)
-    base_name = f"{date_str}-{slug}"
-    print(f"  Using filename base: {base_name}")
-    
-    # Create final output paths (ensure uniqueness)
-    transcript_path = ensure_unique_filename(paths['transcripts'], base_name, 'txt')
-    org_path = ensure_unique_filename(paths['notes'], base_name, 'org')
-    
-    # Move files to their final locations.
-    # Move transcript first — it's the source of truth. If the notes move
-    # fails, we lose only the regenerable summary, not the original data.
-    shutil.move(input_file, transcript_path)
-    print(f"  Moved transcript to: {transcript_path}")
-    
-    shutil.move(temp_org_path, org_path)
-    print(f"  Created: {org_path}")
-    
-    return True, transcript_path, org_path
 
-def git_commit_changes(inbox_files, transcript_files, org_files, workspace_dir):
+    return finalize_summary(input_file, temp_org_path, date_str, paths)
+
+
+def process_transcript_batch(input_files, paths, target='copilot', model=None,
+                             prompt_template=None, debug=False, calendar_path=None):
+    """Process several transcripts with a single LLM invocation.
+
+    Each subprocess spawn pays full CLI and model warmup, so batching N
+    transcripts into one prompt amortizes that cost over the batch. Each
+    item carries its own complete instructions; the model processes them
+    independently and writes one temp org file per transcript.
+
+    Returns a list of (success, transcript_path, org_path) tuples, one per
+    input file, in order.
+    """
+    if len(input_files) == 1:
+        return [process_transcript(input_files[0], paths, target, model,
+                                   prompt_template, debug, calendar_path)]
+
+    workspace_dir = paths['workspace']
+    print(f"\nProcessing batch of {len(input_files)} transcripts:")
+    for f in input_files:
+        print(f"  - {os.path.basename(f)}")
+
+    items = []  # (input_file, date_str, temp_org_filename)
+    sections = []
+    for i, input_file in enumerate(input_files, 1):
+        print(f"  Preparing item {i}: {os.path.basename(input_file)}")
+        item_prompt, date_str, temp_org_filename = build_transcript_prompt(
+            input_file, paths, prompt_template, calendar_path)
+        items.append((input_file, date_str, temp_org_filename))
+        sections.append(f"## Item {i}\n\n{item_prompt}")
+
+    batch_prompt = (
+        f"You will process {len(input_files)} independent meeting transcripts. "
+        "Each item below contains complete instructions, including which file to "
+        "read and which output file to write. Process every item, one at a time, "
+        "writing each output file before moving to the next item. The items are "
+        "unrelated meetings — do not mix content between them.\n\n"
+        + '\n\n'.join(sections)
+    )
+
+    if target == 'copilot':
+        model_name = model if model else 'claude-sonnet-4.5'
+        command = [COPILOT_PATH, '-p', batch_prompt, '--allow-all-tools',
+                   '--allow-all-paths', '--model', model_name]
+    else:
+        print(f"  Error: batch mode is only supported with --target copilot")
+        return [(False, None, None)] * len(input_files)
+
+    print(f"  Generating {len(input_files)} summaries in one invocation...")
+    print(f"  Prompt length: {len(batch_prompt)} chars")
+    batch_timeout = 600 * len(input_files)  # 10 minutes per file
+    start_time = _time.monotonic()
+    try:
+        result = subprocess.run(command, cwd=workspace_dir, capture_output=True,
+                                text=True, timeout=batch_timeout)
+    except subprocess.TimeoutExpired:
+        elapsed = int(_time.monotonic() - start_time)
+        print(f"  Error: Copilot batch timed out after {elapsed}s")
+        result = None
+    except Exception as e:
+        print(f"  Error running copilot batch: {e}")
+        result = None
+
+    if result is not None:
+        elapsed = int(_time.monotonic() - start_time)
+        print(f"  Copilot finished in {elapsed}s (exit code {result.returncode})")
+        if result.returncode != 0:
+            tail = result.stdout[-2000:] if result.stdout else ''
+            print(f"  Error in batch summarization (last output):\n{tail}")
+
+    # Finalize whatever outputs were produced — a partial batch still
+    # moves the completed files; missing outputs count as failures.
+    results = []
+    for input_file, date_str, temp_org_filename in items:
+        temp_org_path = os.path.join(workspace_dir, temp_org_filename)
+        if not os.path.exists(temp_org_path):
+            print(f"  Error: Expected org file {temp_org_path} was not created")
+            results.append((False, None, None))
+            continue
+        results.append(finalize_summary(input_file, temp_org_path, date_str, paths))
+    return results
+
+def git_commit_changes(inbox_files, transcript_files, org_files, workspace_dir, workspace_abs=None):
     """Perform git operations: remove inbox files, add new files, and commit."""
     try:
         # Convert all file paths to be relative to workspace
-        workspace_abs = os.path.abspath(workspace_dir)
+        if workspace_abs is None:
+            workspace_abs = os.path.abspath(workspace_dir)
         
         def make_relative(filepath):
             """Convert filepath to be relative to workspace."""
@@ -1250,14 +1965,15 @@ def git_commit_changes(inbox_files, transcript_files, org_files, workspace_dir):
             return os.path.relpath(abs_path, workspace_abs)
         
         # Stage deletions of inbox files (they've already been moved)
-        # Use 'git add' to stage the deletions since files are already gone
+        # Use 'git add' to stage the deletions since files are already gone.
+        # One invocation for the whole batch — git accepts many paths.
         inbox_paths = [make_relative(f) for f in inbox_files]
-        for rel_path in inbox_paths:
-            result = subprocess.run(['git', 'add', rel_path], capture_output=True, text=True, cwd=workspace_dir)
+        if inbox_paths:
+            result = subprocess.run(['git', 'add', '--'] + inbox_paths, capture_output=True, text=True, cwd=workspace_dir)
             if result.returncode != 0:
-                print(f"  Warning: git add (deletion) failed for {rel_path}: {result.stderr}")
+                print(f"  Warning: git add (deletions) failed: {result.stderr}")
             else:
-                print(f"  Git staged deletion: {rel_path}")
+                print(f"  Git staged {len(inbox_paths)} inbox deletion(s)")
         
         # Git add the new transcript and org files
         files_to_add = [make_relative(f) for f in transcript_files + org_files]
@@ -1292,7 +2008,16 @@ def git_commit_changes(inbox_files, transcript_files, org_files, workspace_dir):
         print(f"  Error during git operations: {e}")
         return False
 
-def process_inbox(paths, target='copilot', model=None, use_git=False, prompt_template=None, debug=False, calendar_path=None):
+def _transcript_date(filepath: str) -> str:
+    """Return the YYYYMMDD date for a transcript, preferring header metadata."""
+    metadata = parse_transcript_header(filepath)
+    start = metadata.get('_meeting_start_dt')
+    if start:
+        return start.strftime('%Y%m%d')
+    return get_date_from_file(filepath)
+
+
+def process_inbox(paths, target='copilot', model=None, use_git=False, prompt_template=None, debug=False, calendar_path=None, batch_size=1, concurrency=1, use_cache=False):
     """Process all transcript files in the inbox directory.
     
     Pre-processing steps before summarization:
@@ -1308,10 +2033,13 @@ def process_inbox(paths, target='copilot', model=None, use_git=False, prompt_tem
         print(f"Error: {inbox_dir} directory not found.")
         return 0, 1  # Count as a failure
     
-    # Find all .txt and .md files in inbox
+    # Find all .txt and .md files in inbox (one scandir pass, no fnmatch)
     transcript_files = []
-    for ext in ['*.txt', '*.md']:
-        transcript_files.extend(glob.glob(os.path.join(inbox_dir, ext)))
+    with os.scandir(inbox_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(('.txt', '.md')) and entry.is_file():
+                transcript_files.append(entry.path)
+    transcript_files.sort()
     
     if not transcript_files:
         print(f"No transcript files found in {inbox_dir}/")
@@ -1324,31 +2052,56 @@ def process_inbox(paths, target='copilot', model=None, use_git=False, prompt_tem
     # Ensure output directories exist
     os.makedirs(paths['transcripts'], exist_ok=True)
     os.makedirs(paths['notes'], exist_ok=True)
+
+    # Same-device moves are pure renames; warn once if the inbox is a
+    # separate mount, where every finalize pays a full copy instead
+    try:
+        if os.stat(inbox_dir).st_dev != os.stat(paths['transcripts']).st_dev:
+            print("  Warning: inbox and transcripts are on different filesystems; moves will copy")
+    except OSError:
+        pass
     
     # --- Step 1: Filter junk transcripts ---
     skipped = 0
     filtered_files = []
+    junk_files = []  # (abs_path, rel_path, basename, reason) awaiting one git rm
+    workspace_abs = paths.get('workspace_abs') or os.path.abspath(paths['workspace'])
     for transcript_file in transcript_files:
         worth_it, reason = is_transcript_worth_processing(transcript_file)
         if not worth_it:
-            print(f"  Skipping {os.path.basename(transcript_file)}: {reason}")
+            basename = os.path.basename(transcript_file)
+            print(f"  Skipping {basename}: {reason}")
             skipped += 1
             if use_git:
-                # Use git rm so deletion is tracked; if git fails, keep the file
-                workspace_abs = os.path.abspath(paths['workspace'])
+                # Collect and remove in one git invocation after the loop
                 rel_path = os.path.relpath(os.path.abspath(transcript_file), workspace_abs)
-                rm_result = subprocess.run(['git', 'rm', '-f', rel_path], capture_output=True, text=True, cwd=paths['workspace'])
-                if rm_result.returncode == 0:
-                    subprocess.run(['git', 'commit', '-m', f'Skip junk transcript: {os.path.basename(transcript_file)} ({reason})'],
-                                   capture_output=True, text=True, cwd=paths['workspace'])
-                else:
-                    # git rm failed — fall back to plain delete
-                    os.remove(transcript_file)
+                junk_files.append((transcript_file, rel_path, basename, reason))
             else:
                 os.remove(transcript_file)
         else:
             filtered_files.append(transcript_file)
-    
+
+    if junk_files:
+        # One git rm + one commit for the whole batch of junk files.
+        # --ignore-unmatch keeps an untracked file from failing the whole
+        # batch (plain git rm is all-or-nothing); whatever git didn't
+        # delete — untracked files, or everything if git itself failed —
+        # is removed directly so junk never survives the filter.
+        rel_paths = [rel for _, rel, _, _ in junk_files]
+        rm_result = subprocess.run(['git', 'rm', '-f', '--ignore-unmatch', '--'] + rel_paths,
+                                   capture_output=True, text=True, cwd=paths['workspace'])
+        for abs_path, _, _, _ in junk_files:
+            if os.path.exists(abs_path):
+                os.remove(abs_path)
+        if rm_result.returncode == 0:
+            if len(junk_files) == 1:
+                _, _, basename, reason = junk_files[0]
+                commit_msg = f'Skip junk transcript: {basename} ({reason})'
+            else:
+                commit_msg = f'Skip {len(junk_files)} junk transcripts'
+            subprocess.run(['git', 'commit', '-m', commit_msg],
+                           capture_output=True, text=True, cwd=paths['workspace'])
+
     if skipped:
         print(f"  Filtered out {skipped} junk transcript(s)")
     
@@ -1358,7 +2111,7 @@ def process_inbox(paths, target='copilot', model=None, use_git=False, prompt_tem
         try:
             split_positions = detect_multi_meeting(
                 transcript_file, calendar_path=calendar_path,
-                target=target, model=model, debug=debug
+                target=target, model=model, debug=debug, use_cache=use_cache
             )
             if split_positions:
                 new_files = split_transcript(transcript_file, split_positions, paths)
@@ -1377,30 +2130,73 @@ def process_inbox(paths, target='copilot', model=None, use_git=False, prompt_tem
     if len(final_files) != len(filtered_files):
         print(f"  After splitting: {len(final_files)} file(s) to process")
     
-    # --- Step 3: Process each transcript ---
+    # --- Step 3: Process transcripts (in date batches when batching enabled) ---
     successful = 0
     failed = 0
-    
-    for transcript_file in final_files:
+
+    if batch_size > 1:
+        # Group by meeting date so each batch shares one calendar context,
+        # then chunk each group to the requested batch size
+        by_date = {}
+        for transcript_file in final_files:
+            by_date.setdefault(_transcript_date(transcript_file), []).append(transcript_file)
+        batches = []
+        for date_files in by_date.values():
+            for i in range(0, len(date_files), batch_size):
+                batches.append(date_files[i:i + batch_size])
+    elif concurrency > 1:
+        # Run per-file summarization in parallel: the work is I/O-bound
+        # (blocked in the subprocess), so threads are enough. Git commits
+        # stay on the main thread as each future completes.
+        print(f"  Processing with concurrency={concurrency}")
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = {
+                pool.submit(process_transcript, f, paths, target, model,
+                            prompt_template, debug, calendar_path): f
+                for f in final_files
+            }
+            for future in as_completed(futures):
+                transcript_file = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Error processing {transcript_file}: {e}")
+                    failed += 1
+                    continue
+                if result[0]:
+                    successful += 1
+                    if use_git:
+                        print(f"  Committing changes for {os.path.basename(transcript_file)}...")
+                        git_commit_changes([transcript_file], [result[1]], [result[2]], paths['workspace'], paths['workspace_abs'])
+                else:
+                    failed += 1
+        batches = []
+    else:
+        batches = [[f] for f in final_files]
+
+    for batch in batches:
         try:
-            result = process_transcript(transcript_file, paths, target, model, prompt_template, debug, calendar_path)
+            results = process_transcript_batch(batch, paths, target, model, prompt_template, debug, calendar_path)
+        except Exception as e:
+            print(f"Error processing batch {[os.path.basename(f) for f in batch]}: {e}")
+            failed += len(batch)
+            continue
+
+        done_inbox, done_transcripts, done_notes = [], [], []
+        for transcript_file, result in zip(batch, results):
             if result[0]:  # Success
                 successful += 1
-                # Immediately commit this file's changes so progress is preserved
-                # even if later files fail or the process times out
-                if use_git:
-                    print(f"  Committing changes for {os.path.basename(transcript_file)}...")
-                    git_commit_changes(
-                        [transcript_file],
-                        [result[1]],
-                        [result[2]],
-                        paths['workspace']
-                    )
+                done_inbox.append(transcript_file)
+                done_transcripts.append(result[1])
+                done_notes.append(result[2])
             else:
                 failed += 1
-        except Exception as e:
-            print(f"Error processing {transcript_file}: {e}")
-            failed += 1
+
+        # Immediately commit this batch's changes so progress is preserved
+        # even if later files fail or the process times out
+        if use_git and done_inbox:
+            print(f"  Committing changes for {len(done_inbox)} file(s)...")
+            git_commit_changes(done_inbox, done_transcripts, done_notes, paths['workspace'], paths['workspace_abs'])
     
     print(f"\n{'='*60}")
     summary_parts = [f"{successful} successful", f"{failed} failed"]
@@ -1427,6 +2223,14 @@ def run_summarization():
                         help='Perform git operations: rm processed inbox files, add new files, and commit. For use in automation/CI.')
     parser.add_argument('--debug', action='store_true',
                         help='Stream AI output to terminal for debugging. Useful when processing hangs.')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='Process up to N same-day transcripts per Copilot invocation to amortize CLI/model warmup. Default: 1 (no batching).')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Summarize up to N transcripts in parallel (separate Copilot invocations). Ignored when --batch-size > 1. Default: 1.')
+    parser.add_argument('--llm-cache', action='store_true',
+                        help='Serve repeated multi-meeting detection prompts from the on-disk LLM response cache (keyed on transcript content).')
+    parser.add_argument('--latency-optimized', action='store_true',
+                        help='Request the latency-optimized inference profile from the LLM backend (sets COPILOT_PERFORMANCE_MODE=latency for spawned CLI processes; ignored by backends without the profile).')
     
     # Calendar enrichment options (Phase 7)
     calendar_group = parser.add_mutually_exclusive_group()
@@ -1436,7 +2240,12 @@ def run_summarization():
                                help='Disable calendar enrichment.')
     
     args = parser.parse_args()
-    
+
+    # Latency hint for the LLM backend — spawned CLI processes inherit it.
+    # Backends without a latency-optimized profile silently ignore it.
+    if args.latency_optimized:
+        os.environ['COPILOT_PERFORMANCE_MODE'] = 'latency'
+
     # Determine workspace directory: CLI arg > env var > current directory
     workspace_dir = args.workspace or os.getenv('WORKSPACE_DIR', '.')
     paths = get_workspace_paths(workspace_dir)
@@ -1458,8 +2267,10 @@ def run_summarization():
             print(f"Created {dir_path}/ directory")
     
     # Process all transcripts in inbox
-    result = process_inbox(paths, target=args.target, model=args.model, use_git=args.git, 
-                          prompt_template=prompt_template, debug=args.debug, calendar_path=calendar_path)
+    result = process_inbox(paths, target=args.target, model=args.model, use_git=args.git,
+                          prompt_template=prompt_template, debug=args.debug, calendar_path=calendar_path,
+                          batch_size=max(1, args.batch_size), concurrency=max(1, args.concurrency),
+                          use_cache=args.llm_cache)
     
     # Exit with appropriate code
     if result is None:
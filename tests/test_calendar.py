@@ -21,6 +21,7 @@ Uses example calendar data in examples/calendar.org.
 Run with: uv run pytest tests/test_calendar.py -v
 """
 
+import io
 import json
 import os
 import sys
@@ -130,6 +131,62 @@ class TestParseCalendarOrg:
         assert len(tuesday_entries) == 3
 
 
+class TestParseCalendarOrgCached:
+    """Tests for the on-disk parsed-calendar cache."""
+
+    def test_cached_result_matches_fresh_parse(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', cache_dir):
+                fresh = run_summarization.parse_calendar_org(EXAMPLE_CALENDAR)
+                first = run_summarization.parse_calendar_org_cached(EXAMPLE_CALENDAR)
+                second = run_summarization.parse_calendar_org_cached(EXAMPLE_CALENDAR)
+                assert first == fresh
+                assert second == fresh
+
+    def test_second_call_skips_parsing(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', cache_dir):
+                run_summarization.parse_calendar_org_cached(EXAMPLE_CALENDAR)
+                with mock.patch.object(run_summarization, 'parse_calendar_org') as parse_mock:
+                    run_summarization.parse_calendar_org_cached(EXAMPLE_CALENDAR)
+                    assert parse_mock.call_count == 0
+
+    def test_invalidates_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, 'cache')
+            calendar_path = os.path.join(tmpdir, 'calendar.org')
+            with open(EXAMPLE_CALENDAR) as f:
+                original = f.read()
+            with open(calendar_path, 'w') as f:
+                f.write(original)
+
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', cache_dir):
+                first = run_summarization.parse_calendar_org_cached(calendar_path)
+                with open(calendar_path, 'a') as f:
+                    f.write('\n* New Meeting <2026-01-28 Wed 10:00-11:00>\n')
+                os.utime(calendar_path)  # Ensure mtime moves even on coarse clocks
+                second = run_summarization.parse_calendar_org_cached(calendar_path)
+            assert len(second) == len(first) + 1
+
+
+class TestCalendarEntriesByDate:
+    """Tests for the date-indexed calendar lookup."""
+
+    def test_groups_entries_by_date(self):
+        by_date = run_summarization.calendar_entries_by_date(EXAMPLE_CALENDAR)
+        assert len(by_date['2026-01-26']) == 5
+        assert len(by_date['2026-01-27']) == 3
+
+    def test_missing_date_not_present(self):
+        by_date = run_summarization.calendar_entries_by_date(EXAMPLE_CALENDAR)
+        assert by_date.get('2026-01-28', []) == []
+
+    def test_index_covers_all_entries(self):
+        entries = run_summarization.parse_calendar_org(EXAMPLE_CALENDAR)
+        by_date = run_summarization.calendar_entries_by_date(EXAMPLE_CALENDAR)
+        assert sum(len(v) for v in by_date.values()) == len(entries)
+
+
 # ============================================================================
 # format_calendar_for_prompt()
 # ============================================================================
@@ -403,7 +460,7 @@ class TestEnrichWithCalendar:
                            calendar_time="14:00-14:30", meeting_link=None,
                            suggested_title="Thabani / Edd 1:1: Test Discussion",
                            suggested_slug="thabani-edd-1-1"):
-        """Create a mock subprocess.run result with LLM JSON response."""
+        """Create a (parsed_object, error_detail) LLM response tuple."""
         response = {
             "matched": matched,
             "confidence": confidence,
@@ -415,7 +472,7 @@ class TestEnrichWithCalendar:
             "suggested_slug": suggested_slug,
             "reasoning": "Participant match"
         }
-        return mock.Mock(returncode=0, stdout=json.dumps(response), stderr='')
+        return response, ''
 
     def test_enriches_matching_entry(self):
         """Should add calendar properties when LLM finds a match."""
@@ -423,9 +480,10 @@ class TestEnrichWithCalendar:
             notes_path = self._make_notes_file(tmpdir)
             transcript_path = self._make_transcript_file(tmpdir)
             
-            with mock.patch('subprocess.run', return_value=self._mock_llm_response()):
+            with mock.patch.object(run_summarization, '_run_json_subprocess',
+                                   return_value=self._mock_llm_response()):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             # Should return (old_path, new_path) since slug changed
             assert result is not None
@@ -445,9 +503,9 @@ class TestEnrichWithCalendar:
             transcript_path = self._make_transcript_file(tmpdir)
             
             low_confidence = self._mock_llm_response(matched=True, confidence=0.5)
-            with mock.patch('subprocess.run', return_value=low_confidence):
+            with mock.patch.object(run_summarization, '_run_json_subprocess', return_value=low_confidence):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is None
 
@@ -458,9 +516,9 @@ class TestEnrichWithCalendar:
             transcript_path = self._make_transcript_file(tmpdir)
             
             no_match = self._mock_llm_response(matched=False, confidence=0.0)
-            with mock.patch('subprocess.run', return_value=no_match):
+            with mock.patch.object(run_summarization, '_run_json_subprocess', return_value=no_match):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is None
 
@@ -472,7 +530,7 @@ class TestEnrichWithCalendar:
             transcript_path = self._make_transcript_file(tmpdir, date="2026-03-15")
             
             result = run_summarization.enrich_with_calendar(
-                notes_path, transcript_path, EXAMPLE_CALENDAR)
+                notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is None
 
@@ -484,9 +542,10 @@ class TestEnrichWithCalendar:
             notes_path = self._make_notes_file(tmpdir)
             transcript_path = self._make_transcript_file(tmpdir)
             
-            with mock.patch('subprocess.run', side_effect=subprocess.TimeoutExpired('cmd', 60)):
+            with mock.patch.object(run_summarization, '_run_json_subprocess',
+                                   side_effect=subprocess.TimeoutExpired('cmd', 60)):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is None
 
@@ -496,10 +555,10 @@ class TestEnrichWithCalendar:
             notes_path = self._make_notes_file(tmpdir)
             transcript_path = self._make_transcript_file(tmpdir)
             
-            bad_response = mock.Mock(returncode=0, stdout='Not valid JSON at all', stderr='')
-            with mock.patch('subprocess.run', return_value=bad_response):
+            bad_response = (None, 'Could not parse LLM response')
+            with mock.patch.object(run_summarization, '_run_json_subprocess', return_value=bad_response):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is None
 
@@ -509,9 +568,10 @@ class TestEnrichWithCalendar:
             notes_path = self._make_notes_file(tmpdir)
             transcript_path = self._make_transcript_file(tmpdir)
             
-            with mock.patch('subprocess.run', return_value=self._mock_llm_response()):
+            with mock.patch.object(run_summarization, '_run_json_subprocess',
+                                   return_value=self._mock_llm_response()):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is not None
             old_path, new_path = result
@@ -531,9 +591,9 @@ class TestEnrichWithCalendar:
             transcript_path = self._make_transcript_file(tmpdir, slug="thabani-edd-1-1")
             
             same_slug = self._mock_llm_response(suggested_slug="thabani-edd-1-1")
-            with mock.patch('subprocess.run', return_value=same_slug):
+            with mock.patch.object(run_summarization, '_run_json_subprocess', return_value=same_slug):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             # Should return None — no rename happened (properties added in place)
             assert result is None
@@ -546,9 +606,9 @@ class TestEnrichWithCalendar:
             
             response_with_link = self._mock_llm_response(
                 meeting_link="https://teams.microsoft.com/l/meetup-join/ghi789")
-            with mock.patch('subprocess.run', return_value=response_with_link):
+            with mock.patch.object(run_summarization, '_run_json_subprocess', return_value=response_with_link):
                 result = run_summarization.enrich_with_calendar(
-                    notes_path, transcript_path, EXAMPLE_CALENDAR)
+                    notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=False)
             
             assert result is not None
             _, new_path = result
@@ -557,6 +617,150 @@ class TestEnrichWithCalendar:
             assert ':MEETING_LINK: https://teams.microsoft.com/l/meetup-join/ghi789' in content
 
 
+# ============================================================================
+# LLM response cache
+# ============================================================================
+
+class TestLlmResponseCache:
+    """Tests for the persistent LLM response cache."""
+
+    def test_miss_returns_none(self):
+        """Cache lookup for an unknown prompt should return None."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', tmpdir):
+                assert run_summarization.llm_cache_get('model-x', 'never seen') is None
+
+    def test_put_then_get_roundtrip(self):
+        """Stored responses should come back intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', tmpdir):
+                result = {'matched': True, 'confidence': 0.9}
+                run_summarization.llm_cache_put('model-x', 'prompt text', result)
+                assert run_summarization.llm_cache_get('model-x', 'prompt text') == result
+
+    def test_key_includes_model(self):
+        """Same prompt under a different model should miss."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', tmpdir):
+                run_summarization.llm_cache_put('model-x', 'prompt', {'a': 1})
+                assert run_summarization.llm_cache_get('model-y', 'prompt') is None
+
+    def test_enrich_uses_cache_on_second_run(self):
+        """With use_cache=True, a repeat enrichment should skip the subprocess."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, 'cache')
+            helper = TestEnrichWithCalendar()
+            response = helper._mock_llm_response()
+
+            with mock.patch.object(run_summarization, 'LLM_CACHE_DIR', cache_dir):
+                notes_path = helper._make_notes_file(tmpdir)
+                transcript_path = helper._make_transcript_file(tmpdir)
+                with mock.patch.object(run_summarization, '_run_json_subprocess',
+                                       return_value=response) as run_mock:
+                    first = run_summarization.enrich_with_calendar(
+                        notes_path, transcript_path, EXAMPLE_CALENDAR,
+                        use_cache=True, use_api=False)
+                assert first is not None
+                assert run_mock.call_count == 1
+
+                # Recreate identical input files; the prompt is now cached
+                notes_path = helper._make_notes_file(tmpdir)
+                transcript_path = helper._make_transcript_file(tmpdir)
+                with mock.patch.object(run_summarization, '_run_json_subprocess',
+                                       return_value=response) as run_mock:
+                    second = run_summarization.enrich_with_calendar(
+                        notes_path, transcript_path, EXAMPLE_CALENDAR,
+                        use_cache=True, use_api=False)
+                assert second is not None
+                assert run_mock.call_count == 0
+
+
+# ============================================================================
+# _llm_json_via_api() — direct provider API path (urlopen mocked)
+# ============================================================================
+
+class TestLlmJsonViaApi:
+    """Tests for the direct-API calendar match path."""
+
+    def _api_response(self, text='{"matched": true, "confidence": 0.9}'):
+        payload = {'content': [{'type': 'text', 'text': text}]}
+        return io.BytesIO(json.dumps(payload).encode('utf-8'))
+
+    def test_maps_cli_model_alias(self):
+        """CLI model names should be translated to API model names."""
+        captured = {}
+
+        def fake_urlopen(request, timeout=None):
+            captured['body'] = json.loads(request.data)
+            captured['headers'] = dict(request.header_items())
+            return self._api_response()
+
+        with mock.patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            with mock.patch.object(run_summarization.urllib.request, 'urlopen', fake_urlopen):
+                result = run_summarization._llm_json_via_api('match this', 'claude-sonnet-4.5')
+
+        assert result == {'matched': True, 'confidence': 0.9}
+        assert captured['body']['model'] == 'claude-sonnet-4-5'
+        assert captured['body']['messages'][0]['content'] == 'match this'
+
+    def test_static_prefix_becomes_cached_block(self):
+        """static_prefix should be a separate content block with cache_control."""
+        captured = {}
+
+        def fake_urlopen(request, timeout=None):
+            captured['body'] = json.loads(request.data)
+            return self._api_response()
+
+        with mock.patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            with mock.patch.object(run_summarization.urllib.request, 'urlopen', fake_urlopen):
+                run_summarization._llm_json_via_api(
+                    'dynamic tail', 'claude-sonnet-4.5', static_prefix='STATIC INSTRUCTIONS')
+
+        content = captured['body']['messages'][0]['content']
+        assert content[0] == {'type': 'text', 'text': 'STATIC INSTRUCTIONS',
+                              'cache_control': {'type': 'ephemeral'}}
+        assert content[1] == {'type': 'text', 'text': 'dynamic tail'}
+
+    def test_returns_none_without_api_key(self):
+        """No key means no API call — callers fall back to the CLI."""
+        env = {k: v for k, v in os.environ.items() if k != 'ANTHROPIC_API_KEY'}
+        with mock.patch.dict(os.environ, env, clear=True):
+            with mock.patch.object(run_summarization.urllib.request, 'urlopen') as urlopen_mock:
+                assert run_summarization._llm_json_via_api('prompt', 'claude-sonnet-4.5') is None
+        assert urlopen_mock.call_count == 0
+
+    def test_falls_back_on_network_error(self):
+        """URLError should yield None so enrichment retries via the CLI."""
+        import urllib.error
+
+        with mock.patch.dict(os.environ, {'ANTHROPIC_API_KEY': 'test-key'}):
+            with mock.patch.object(run_summarization.urllib.request, 'urlopen',
+                                   side_effect=urllib.error.URLError('unreachable')):
+                assert run_summarization._llm_json_via_api('prompt', 'claude-sonnet-4.5') is None
+
+    def test_enrich_prefers_api_and_splits_prefix(self):
+        """With the API available, enrichment should skip the CLI subprocess
+        and send the shared instructions as the cacheable prefix."""
+        helper = TestEnrichWithCalendar()
+        response = helper._mock_llm_response()[0]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            notes_path = helper._make_notes_file(tmpdir)
+            transcript_path = helper._make_transcript_file(tmpdir)
+
+            with mock.patch.object(run_summarization, '_llm_json_via_api',
+                                   return_value=response) as api_mock:
+                with mock.patch.object(run_summarization, '_run_json_subprocess') as cli_mock:
+                    result = run_summarization.enrich_with_calendar(
+                        notes_path, transcript_path, EXAMPLE_CALENDAR, use_api=True)
+
+        assert result is not None
+        assert cli_mock.call_count == 0
+        assert api_mock.call_count == 1
+        kwargs = api_mock.call_args.kwargs
+        assert kwargs['static_prefix'] == run_summarization.CALENDAR_MATCH_INSTRUCTIONS
+
+
 # ============================================================================
 # End-to-end: parse → filter → format pipeline
 # ============================================================================
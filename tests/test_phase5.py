@@ -378,7 +378,7 @@ class TestWorkflowDispatch:
         agent = meetingnotesd.RepoAgent(minimal_config)
         
         with mock.patch.dict(os.environ, {"GH_TOKEN": "test-token"}):
-            with mock.patch("requests.post") as mock_post:
+            with mock.patch.object(agent._http, "post") as mock_post:
                 mock_post.return_value = mock.Mock(status_code=204, text="")
                 
                 success, message = agent.maybe_dispatch_workflow(reason="test")
@@ -416,7 +416,7 @@ class TestWorkflowDispatch:
         agent = meetingnotesd.RepoAgent(minimal_config)
         
         with mock.patch.dict(os.environ, {"GH_TOKEN": "test-token"}):
-            with mock.patch("requests.post") as mock_post:
+            with mock.patch.object(agent._http, "post") as mock_post:
                 mock_post.return_value = mock.Mock(status_code=404, text="Not Found")
                 
                 success, message = agent.maybe_dispatch_workflow(reason="test")
@@ -508,6 +508,55 @@ class TestWebhookEndpoint:
         assert len(sync_called) >= 1  # Sync was called at least once
 
 
+class TestWebhookQueue:
+    """Queued webhook mode: accept immediately, process in workers."""
+
+    @pytest.fixture
+    def queue_client(self, minimal_config, temp_workspace, monkeypatch):
+        minimal_config["server"]["webhook_queue"] = {"enabled": True, "workers": 1}
+        minimal_config["sync"]["enabled"] = False
+
+        agent = meetingnotesd.RepoAgent(minimal_config)
+        agent.start_webhook_workers()
+        monkeypatch.setattr("meetingnotesd.agent", agent)
+
+        meetingnotesd.app.config["TESTING"] = True
+        return meetingnotesd.app.test_client(), agent
+
+    def test_webhook_returns_202_and_worker_processes(self, queue_client, temp_workspace):
+        client, agent = queue_client
+
+        response = client.post(
+            "/webhook",
+            json={"title": "Queued Meeting", "transcript": "Discussion content. " * 20},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 202
+        data = response.get_json()
+        assert data["status"] == "accepted"
+        assert "queued-meeting" in data["filename"]
+
+        # Wait for the worker to drain the queue, then the file exists
+        agent._webhook_queue.join()
+        written = list(temp_workspace["inbox"].glob("*queued-meeting.txt"))
+        assert len(written) == 1
+        assert "Discussion content." in written[0].read_text()
+
+    def test_webhook_queue_full_returns_503(self, queue_client):
+        client, agent = queue_client
+
+        # Fill the queue without any worker able to drain it
+        with mock.patch.object(agent, "enqueue_transcript", return_value=False):
+            response = client.post(
+                "/webhook",
+                json={"title": "Overflow", "transcript": "Content here"},
+                content_type="application/json",
+            )
+
+        assert response.status_code == 503
+
+
 class TestBackgroundSync:
     """Tests for background sync thread."""
 
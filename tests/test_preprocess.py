@@ -210,3 +210,19 @@ class TestExtractJsonObject:
 
     def test_malformed_json(self):
         assert run_summarization._extract_json_object("{bad json}") is None
+
+    def test_braces_inside_strings(self):
+        result = run_summarization._extract_json_object(
+            '{"reasoning": "text with } and { braces", "count": 1}'
+        )
+        assert result == {"reasoning": "text with } and { braces", "count": 1}
+
+    def test_escaped_quotes_inside_strings(self):
+        result = run_summarization._extract_json_object(
+            '{"reasoning": "she said \\"bye\\" then }", "count": 2}'
+        )
+        assert result["count"] == 2
+
+    def test_malformed_then_valid_object(self):
+        result = run_summarization._extract_json_object('{bad} then {"ok": true}')
+        assert result == {"ok": True}